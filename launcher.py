@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 from plan_classe.model.eleve import Eleve
 from plan_classe.model.salle import Salle
+from plan_classe.solveur.base import Solveur
+from plan_classe.solveur.contraintes import charger_contraintes
+from plan_classe.solveur.rotation import PlanificateurRotation
 from main import lancer_pygame
 import csv
 import threading
@@ -26,6 +29,9 @@ def charger_eleves_depuis_csv(path: str) -> list[Eleve]:
 def lancer() -> None:
     """
     Récupère les données des champs, construit la salle et lance Pygame dans un thread.
+
+    Si le placement automatique est demandé, les élèves sont placés en respectant les
+    contraintes du fichier .contraintes rangé à côté du CSV (s'il existe).
     """
     try:
         path_csv = entry_csv.get()
@@ -35,6 +41,12 @@ def lancer() -> None:
         eleves = charger_eleves_depuis_csv(path_csv)
         salle = Salle.depuis_mode_compact(nb_lignes=nb_lignes, capacites_par_table=capacites)
 
+        if placement_auto.get():
+            contraintes = charger_contraintes(path_csv)
+            plan = PlanificateurRotation(salle, contraintes=contraintes).planifier(eleves, 1)[0]
+            Solveur.appliquer(salle, plan)
+            eleves = [eleve for eleve in eleves if eleve not in plan]
+
         # Lancement de Pygame dans un thread séparé
         threading.Thread(target=lancer_pygame, args=(salle, eleves), daemon=True).start()
 
@@ -64,6 +76,10 @@ entry_capacites = tk.Entry(root)
 entry_capacites.insert(0, "3,4,4")
 entry_capacites.pack()
 
+placement_auto = tk.BooleanVar(value=False)
+tk.Checkbutton(root, text="Placement automatique (contraintes du fichier .contraintes)",
+               variable=placement_auto).pack()
+
 tk.Button(root, text="Lancer", command=lancer).pack(pady=10)
 
 root.mainloop()
@@ -2,11 +2,12 @@ import pygame
 
 from plan_classe.model.eleve import Eleve
 from plan_classe.model.salle import Salle
+from plan_classe.solveur.reparation import Reparateur
 from plan_classe.ui.planvisuel import PlanVisuel
 
 
 def lancer_pygame(salle: Salle, eleves: list[Eleve]) -> None:
-    visuel = PlanVisuel(salle, eleves)
+    visuel = PlanVisuel(salle, eleves, reparateur=Reparateur())
     visuel.afficher()
 
     clock = pygame.time.Clock()
@@ -0,0 +1,232 @@
+import argparse
+import csv
+import json
+import math
+import random
+from datetime import date, timedelta
+from typing import Iterator, List, Tuple
+
+from plan_classe.model.salle import Salle
+from plan_classe.solveur.contraintes import chemin_contraintes
+
+PRENOMS_F: Tuple[str, ...] = (
+    "Adèle", "Alice", "Ambre", "Anna", "Camille", "Chloé", "Clara", "Élise", "Emma", "Eva",
+    "Inès", "Jade", "Jeanne", "Juliette", "Léa", "Léna", "Lina", "Lola", "Louise", "Lucie",
+    "Manon", "Margaux", "Marie", "Mathilde", "Nina", "Noémie", "Océane", "Romane", "Rose", "Zoé",
+)
+PRENOMS_M: Tuple[str, ...] = (
+    "Adam", "Arthur", "Baptiste", "Clément", "Enzo", "Ethan", "Gabriel", "Hugo", "Jules", "Léo",
+    "Liam", "Louis", "Lucas", "Malo", "Mathis", "Maël", "Nathan", "Noah", "Paul", "Raphaël",
+    "Sacha", "Samuel", "Théo", "Thomas", "Timéo", "Tom", "Valentin", "Victor", "Yanis", "Jean-Baptiste",
+)
+SYLLABES: Tuple[str, ...] = (
+    "BER", "BON", "CHA", "DA", "DE", "DU", "FA", "FON", "GAR", "GI", "LA", "LE", "LOU", "MA",
+    "MAR", "MON", "MOR", "NA", "NI", "PE", "PI", "RAN", "RI", "RO", "ROU", "SAN", "SO", "TA",
+    "TEL", "TI", "VAL", "VER", "VI", "BRE", "CLO", "DRO", "GRA", "TRE", "QUE", "LIN",
+)
+NIVEAUX: Tuple[str, ...] = ("6", "5", "4", "3")
+
+NB_NOMS_FAMILLE: int = len(SYLLABES) ** 2 + len(SYLLABES) ** 3
+# Chaque combinaison (genre, prénom, nom de famille) correspond à un seul élève.
+NB_NOMS_DISTINCTS: int = len(PRENOMS_F) * 2 * NB_NOMS_FAMILLE
+
+
+def _nom_famille(indice: int) -> str:
+    """Construit le nom de famille d'indice donné (deux ou trois syllabes)."""
+    n = len(SYLLABES)
+    if indice < n ** 2:
+        return SYLLABES[indice // n] + SYLLABES[indice % n]
+    indice -= n ** 2
+    return SYLLABES[indice // n ** 2] + SYLLABES[(indice // n) % n] + SYLLABES[indice % n]
+
+
+def _nom_classe(indice: int) -> str:
+    """Nom de la classe d'indice donné : 6A, 5A, 4A, 3A, 6B, ..., 3Z, 6AA, ..."""
+    groupe = indice // len(NIVEAUX)
+    lettres = ""
+    while True:
+        lettres = chr(ord("A") + groupe % 26) + lettres
+        groupe = groupe // 26 - 1
+        if groupe < 0:
+            break
+    return NIVEAUX[indice % len(NIVEAUX)] + lettres
+
+
+def generer_eleves(nb_eleves: int, graine: int, taille_classe: int = 30) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Produit des lignes d'élèves au format de l'export Pronote :
+    (« NOM Prénom », date de naissance, classe, genre).
+
+    Les lignes sont produites au fil de l'eau et ne dépendent que de la graine. Les noms
+    sont tous distincts : l'indice de chaque élève est brouillé par une permutation affine
+    de l'espace des noms possibles.
+
+    Args:
+        nb_eleves: Nombre d'élèves à produire (au plus `NB_NOMS_DISTINCTS`).
+        graine: Graine du générateur.
+        taille_classe: Nombre d'élèves par classe.
+
+    Raises:
+        ValueError: si le nombre d'élèves dépasse le nombre de noms distincts.
+    """
+    if nb_eleves > NB_NOMS_DISTINCTS:
+        raise ValueError(f"Au plus {NB_NOMS_DISTINCTS} élèves distincts peuvent être générés")
+    rng = random.Random(graine)
+    multiplicateur = rng.randrange(1, NB_NOMS_DISTINCTS)
+    while math.gcd(multiplicateur, NB_NOMS_DISTINCTS) != 1:
+        multiplicateur = rng.randrange(1, NB_NOMS_DISTINCTS)
+    decalage = rng.randrange(NB_NOMS_DISTINCTS)
+    naissance_min = date(2008, 1, 1)
+
+    for i in range(nb_eleves):
+        k = (multiplicateur * i + decalage) % NB_NOMS_DISTINCTS
+        genre = "F" if k % 2 == 0 else "M"
+        prenoms = PRENOMS_F if genre == "F" else PRENOMS_M
+        k //= 2
+        prenom = prenoms[k % len(prenoms)]
+        nom = _nom_famille(k // len(prenoms))
+
+        classe_indice = i // taille_classe
+        annees = len(NIVEAUX) - 1 - classe_indice % len(NIVEAUX)  # les 6e sont les plus jeunes
+        naissance = naissance_min + timedelta(days=365 * annees + rng.randrange(365))
+        yield f"{nom} {prenom}", naissance.strftime("%d/%m/%Y"), _nom_classe(classe_indice), genre
+
+
+def generer_contraintes_classe(noms: List[str], rng: random.Random, nb_contraintes: int) -> List[str]:
+    """
+    Tire des contraintes au hasard entre les élèves d'une même classe,
+    dans la syntaxe des fichiers de contraintes.
+    """
+    lignes: List[str] = []
+    if not noms:
+        return lignes
+    for _ in range(nb_contraintes):
+        tirage = rng.random()
+        if tirage < 0.6 and len(noms) >= 2:
+            a, b = rng.sample(noms, 2)
+            lignes.append(f'"{a}" pas_a_cote "{b}"')
+        elif tirage < 0.85:
+            debut = rng.randrange(3)
+            lignes.append(f'"{rng.choice(noms)}" rangees {debut}-{debut + rng.randrange(1, 4)}')
+        else:
+            lignes.append(f'"{rng.choice(noms)}" pres_bureau {rng.choice((1.5, 2, 3))}')
+    return lignes
+
+
+def ecrire_pronote(
+        chemin_csv: str,
+        nb_eleves: int,
+        graine: int,
+        taille_classe: int = 30,
+        contraintes_par_classe: int = 0,
+        alterner_genre: bool = False
+) -> None:
+    """
+    Écrit un export Pronote synthétique (séparateur « ; », sans en-tête, lisible par
+    `charger_eleves_depuis_csv`) et, si demandé, le fichier de contraintes associé.
+
+    Seule la classe en cours est gardée en mémoire.
+
+    Args:
+        chemin_csv: Fichier CSV à écrire.
+        nb_eleves: Nombre total d'élèves.
+        graine: Graine du générateur.
+        taille_classe: Nombre d'élèves par classe.
+        contraintes_par_classe: Nombre de contraintes tirées dans chaque classe
+                                (0 : aucun fichier de contraintes).
+        alterner_genre: Ajoute la contrainte d'alternance des genres.
+    """
+    rng_contraintes = random.Random(graine + 1)
+    fichier_contraintes = None
+    if contraintes_par_classe > 0 or alterner_genre:
+        fichier_contraintes = open(chemin_contraintes(chemin_csv), "w", encoding="utf-8")
+        if alterner_genre:
+            fichier_contraintes.write("alterner_genre\n")
+
+    try:
+        with open(chemin_csv, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f, delimiter=";")
+            classe: List[str] = []
+            for ligne in generer_eleves(nb_eleves, graine, taille_classe):
+                writer.writerow(ligne)
+                classe.append(ligne[0])
+                if len(classe) == taille_classe:
+                    if fichier_contraintes is not None:
+                        for contrainte in generer_contraintes_classe(classe, rng_contraintes, contraintes_par_classe):
+                            fichier_contraintes.write(contrainte + "\n")
+                    classe.clear()
+            if classe and fichier_contraintes is not None:
+                for contrainte in generer_contraintes_classe(classe, rng_contraintes, contraintes_par_classe):
+                    fichier_contraintes.write(contrainte + "\n")
+    finally:
+        if fichier_contraintes is not None:
+            fichier_contraintes.close()
+
+
+def generer_salles(nb_salles: int, graine: int, taux_invalides: float = 0.02) -> Iterator[dict]:
+    """
+    Produit des descriptions de salles : schéma (rangées × capacités par table) et
+    places désactivées.
+
+    Args:
+        nb_salles: Nombre de salles.
+        graine: Graine du générateur.
+        taux_invalides: Proportion moyenne de places désactivées.
+    """
+    rng = random.Random(graine)
+    for k in range(nb_salles):
+        capacites = [rng.choice((2, 2, 3, 4)) for _ in range(rng.randint(2, 4))]
+        nb_lignes = rng.randint(5, 10)
+        invalides = [
+            [x, y, i]
+            for y in range(nb_lignes)
+            for x, capacite in enumerate(capacites)
+            for i in range(capacite)
+            if rng.random() < taux_invalides
+        ]
+        yield {"nom": f"S{k + 1:03d}", "schema": [capacites.copy() for _ in range(nb_lignes)], "invalides": invalides}
+
+
+def ecrire_salles(chemin: str, nb_salles: int, graine: int, taux_invalides: float = 0.02) -> None:
+    """Écrit des descriptions de salles, une par ligne au format JSON."""
+    with open(chemin, "w", encoding="utf-8") as f:
+        for salle in generer_salles(nb_salles, graine, taux_invalides):
+            f.write(json.dumps(salle) + "\n")
+
+
+def charger_salles(chemin: str) -> Iterator[Salle]:
+    """Relit, une par une, les salles écrites par `ecrire_salles`."""
+    with open(chemin, encoding="utf-8") as f:
+        for ligne in f:
+            if not ligne.strip():
+                continue
+            description = json.loads(ligne)
+            salle = Salle(description["schema"])
+            for x, y, i in description["invalides"]:
+                salle.get_table(x, y).invalider(i)
+            yield salle
+
+
+def main() -> None:
+    """
+    Point d'entrée en ligne de commande, par exemple :
+        python -m plan_classe.generateur eleves.csv 100000 --graine 42 --contraintes 3 --salles salles.jsonl
+    """
+    parser = argparse.ArgumentParser(description="Génère des données synthétiques pour les tests de charge.")
+    parser.add_argument("csv", help="export Pronote à écrire")
+    parser.add_argument("nb_eleves", type=int)
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--taille-classe", type=int, default=30)
+    parser.add_argument("--contraintes", type=int, default=0, help="nombre de contraintes par classe")
+    parser.add_argument("--alterner-genre", action="store_true")
+    parser.add_argument("--salles", help="fichier de salles à écrire (JSON, une salle par ligne)")
+    parser.add_argument("--nb-salles", type=int, default=10)
+    args = parser.parse_args()
+
+    ecrire_pronote(args.csv, args.nb_eleves, args.graine, args.taille_classe, args.contraintes, args.alterner_genre)
+    if args.salles:
+        ecrire_salles(args.salles, args.nb_salles, args.graine)
+
+
+if __name__ == "__main__":
+    main()
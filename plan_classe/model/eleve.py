@@ -7,17 +7,19 @@ class Eleve:
     Représente un élève pouvant être placé sur une table dans le plan de classe.
     """
 
-    def __init__(self, nom: str, genre: str) -> None:
+    def __init__(self, nom: str, genre: str, classe: str = "") -> None:
         """
         Initialise un nouvel élève.
 
         Args:
             nom: Le nom de l'élève.
             genre: Le genre, typiquement "F" ou "M".
+            classe: La classe de l'élève (utile lorsque plusieurs classes partagent une salle).
         """
 
         self._nom: str = nom.strip()
         self._genre: str = genre.strip()
+        self._classe: str = classe.strip()
         self._position: Optional[Tuple[int, int]] = None
         self._fixe: bool = False
 
@@ -46,6 +48,10 @@ class Eleve:
         """Retourne le genre de l'élève."""
         return self._genre
 
+    def get_classe(self) -> str:
+        """Retourne la classe de l'élève (chaîne vide si inconnue)."""
+        return self._classe
+
     def get_position(self) -> Optional[Tuple[int, int]]:
         """Retourne la position actuelle de l'élève (x, y) ou None."""
         return self._position
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 from .table import Table
 
 
@@ -18,7 +18,6 @@ class Salle:
         self._tables: List[Table] = []
         for row_index, ligne in enumerate(schema):
             for col_index, capacite in enumerate(ligne):
-                print(col_index, row_index, capacite)
                 self._tables.append(Table(x=col_index, y=row_index, capacite=capacite))
 
     @classmethod
@@ -43,6 +42,26 @@ class Salle:
         """Retourne toutes les tables de la salle."""
         return self._tables
 
+    def get_table(self, x: int, y: int) -> Optional[Table]:
+        """Retourne la table située en (colonne x, rangée y), ou None si elle n'existe pas."""
+        for table in self._tables:
+            if table.get_position() == (x, y):
+                return table
+        return None
+
+    def get_sieges(self) -> List[Tuple[int, int, int]]:
+        """
+        Retourne toutes les places de la salle sous la forme (colonne, rangée, numéro de place).
+
+        L'ordre est stable (ordre des tables puis numéro de place) : la position d'un siège
+        dans cette liste sert d'indice de siège.
+        """
+        return [
+            (*table.get_position(), i)
+            for table in self._tables
+            for i in range(table.get_capacite())
+        ]
+
     def get_schema(self) -> List[List[int]]:
         """Retourne le schéma brut sous forme de liste de listes."""
         max_x = max(t.get_position()[0] for t in self._tables) + 1
@@ -0,0 +1,140 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, List, Set, Tuple
+
+from plan_classe.model.eleve import Eleve
+from plan_classe.model.salle import Salle
+
+# Une place est repérée par (colonne, rangée, numéro de place sur la table).
+Siege = Tuple[int, int, int]
+
+# Résultat d'un solveur : la place attribuée à chaque élève.
+Affectation = Dict[Eleve, Siege]
+
+
+def verifier_noms_uniques(eleves: List[Eleve]) -> None:
+    """
+    Vérifie que deux élèves ne portent pas le même nom : les affectations sont indexées
+    par élève, et deux élèves de même nom y seraient confondus.
+
+    Raises:
+        ValueError: si un nom apparaît plusieurs fois.
+    """
+    vus: Set[Eleve] = set()
+    for eleve in eleves:
+        if eleve in vus:
+            raise ValueError(f"Plusieurs élèves s'appellent {eleve.get_nom()} : "
+                             f"distinguez-les (par exemple avec la classe) avant de les placer")
+        vus.add(eleve)
+
+
+def places_libres(salle: Salle) -> List[Siege]:
+    """Retourne les places valides et inoccupées de la salle."""
+    return [
+        (*table.get_position(), i)
+        for table in salle.get_tables()
+        for i in range(table.get_capacite())
+        if table.est_libre(i)
+    ]
+
+
+def places_valides(salle: Salle) -> List[Siege]:
+    """Retourne les places valides de la salle, qu'elles soient occupées ou non."""
+    return [
+        (*table.get_position(), i)
+        for table in salle.get_tables()
+        for i in range(table.get_capacite())
+        if table.est_valide(i)
+    ]
+
+
+def affectation_courante(salle: Salle) -> Affectation:
+    """Retourne l'affectation actuellement en place dans la salle."""
+    affectation: Affectation = {}
+    for table in salle.get_tables():
+        x, y = table.get_position()
+        for i, eleve in enumerate(table.get_places()):
+            if eleve is not None:
+                affectation[eleve] = (x, y, i)
+    return affectation
+
+
+def sieges_voisins(salle: Salle) -> Dict[Siege, List[Siege]]:
+    """
+    Retourne, pour chaque place, les places voisines (côte à côte sur la même table).
+    """
+    voisins: Dict[Siege, List[Siege]] = {}
+    for table in salle.get_tables():
+        x, y = table.get_position()
+        capacite = table.get_capacite()
+        for i in range(capacite):
+            voisins[(x, y, i)] = [(x, y, j) for j in (i - 1, i + 1) if 0 <= j < capacite]
+    return voisins
+
+
+def coordonnees_sieges(salle: Salle) -> List[Tuple[float, float]]:
+    """
+    Retourne les coordonnées du centre de chaque place, dans l'ordre de `Salle.get_sieges`.
+
+    L'unité horizontale est la largeur d'une place (les colonnes sont juxtaposées, chacune
+    aussi large que sa plus grande table) ; l'unité verticale est la rangée.
+    """
+    largeurs = [max(colonne) for colonne in salle.get_schema()]
+    debuts = [sum(largeurs[:x]) for x in range(len(largeurs))]
+    coordonnees: List[Tuple[float, float]] = []
+    for table in salle.get_tables():
+        x, y = table.get_position()
+        capacite = table.get_capacite()
+        gauche = debuts[x] + (largeurs[x] - capacite) / 2
+        coordonnees.extend((gauche + i + 0.5, float(y)) for i in range(capacite))
+    return coordonnees
+
+
+def distances_bureau(salle: Salle) -> List[float]:
+    """
+    Retourne la distance de chaque place au bureau (centré devant la première rangée),
+    dans l'ordre de `Salle.get_sieges`.
+    """
+    largeur = sum(max(colonne) for colonne in salle.get_schema())
+    x_bureau, y_bureau = largeur / 2, -1.0
+    return [math.hypot(x - x_bureau, y - y_bureau) for x, y in coordonnees_sieges(salle)]
+
+
+class Solveur(ABC):
+    """
+    Interface commune des solveurs de plan de classe.
+
+    Un solveur ne modifie pas la salle : il renvoie une affectation, que l'on applique
+    ensuite avec `appliquer`. Cela permet de résoudre dans un autre processus.
+    """
+
+    @abstractmethod
+    def resoudre(self, salle: Salle, eleves: List[Eleve]) -> Affectation:
+        """
+        Calcule une place pour chacun des élèves donnés.
+
+        Args:
+            salle: La salle dans laquelle placer les élèves.
+            eleves: Les élèves à placer.
+
+        Returns:
+            L'affectation élève → siège.
+        """
+
+    @staticmethod
+    def appliquer(salle: Salle, affectation: Affectation) -> None:
+        """
+        Place les élèves de l'affectation sur les tables de la salle.
+
+        Args:
+            salle: La salle à modifier.
+            affectation: L'affectation élève → siège à appliquer.
+
+        Raises:
+            ValueError: si un siège n'existe pas ou n'est pas libre.
+        """
+        for eleve, (x, y, index) in affectation.items():
+            table = salle.get_table(x, y)
+            if table is None or not table.est_libre(index):
+                raise ValueError(f"Place ({x}, {y}, {index}) indisponible pour {eleve.get_nom()}")
+            table.placer_eleve(eleve, index)
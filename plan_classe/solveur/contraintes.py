@@ -0,0 +1,321 @@
+import os
+import shlex
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from plan_classe.model.eleve import Eleve
+from plan_classe.model.salle import Salle
+from plan_classe.solveur.base import Affectation, Siege, distances_bureau, sieges_voisins
+
+# Un prédicat compilé reçoit (positions, occupants) et renvoie True s'il est violé :
+#   positions[e] = indice du siège de l'élève e (-1 s'il n'est pas placé)
+#   occupants[s] = indice de l'élève assis au siège s (-1 si la place est vide)
+Predicat = Callable[[List[int], List[int]], bool]
+
+EXTENSION_CONTRAINTES: str = ".contraintes"
+DISTANCE_BUREAU_DEFAUT: float = 2.0
+
+
+class Contrainte:
+    """
+    Contrainte de placement telle qu'écrite dans un fichier de contraintes.
+
+    Types reconnus (les noms sont ceux de l'export Pronote, entre guillemets) :
+        "A" pas_a_cote "B"      A et B ne sont pas côte à côte
+        "A" a_cote "B"          A et B sont côte à côte
+        "C" rangees 0-2         C est assis dans les rangées 0 à 2 (ou une seule : rangees 3)
+        "D" pres_bureau [d]     D est à une distance au plus d du bureau (défaut : 2 places)
+        alterner_genre          deux voisins de table ne sont pas du même genre
+    """
+
+    TYPES: Tuple[str, ...] = ("pas_a_cote", "a_cote", "rangees", "pres_bureau", "alterner_genre")
+
+    def __init__(self, type_contrainte: str, noms: Tuple[str, ...] = (), parametres: Tuple[float, ...] = ()) -> None:
+        """
+        Args:
+            type_contrainte: L'un des `TYPES`.
+            noms: Noms des élèves concernés.
+            parametres: Paramètres numériques (bornes de rangées, distance).
+        """
+        self.type: str = type_contrainte
+        self.noms: Tuple[str, ...] = noms
+        self.parametres: Tuple[float, ...] = parametres
+
+    def __str__(self) -> str:
+        noms = [f'"{nom}"' for nom in self.noms]
+        if self.type in ("pas_a_cote", "a_cote"):
+            return f"{noms[0]} {self.type} {noms[1]}"
+        if self.type == "rangees":
+            return f"{noms[0]} rangees {int(self.parametres[0])}-{int(self.parametres[1])}"
+        if self.type == "pres_bureau":
+            return f"{noms[0]} pres_bureau {self.parametres[0]:g}"
+        return self.type
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, Contrainte) and self.type == other.type
+                and self.noms == other.noms and self.parametres == other.parametres)
+
+    def __hash__(self) -> int:
+        return hash((self.type, self.noms, self.parametres))
+
+
+def analyser_ligne(ligne: str) -> Optional[Contrainte]:
+    """
+    Analyse une ligne du fichier de contraintes.
+
+    Returns:
+        La contrainte, ou None pour une ligne vide ou un commentaire (#).
+
+    Raises:
+        ValueError: si la ligne est mal formée.
+    """
+    mots = shlex.split(ligne, comments=True)
+    if not mots:
+        return None
+
+    if mots == ["alterner_genre"]:
+        return Contrainte("alterner_genre")
+
+    if len(mots) < 2 or mots[1] not in Contrainte.TYPES:
+        raise ValueError(f"Contrainte non reconnue : {ligne.strip()}")
+    nom, type_contrainte, arguments = mots[0], mots[1], mots[2:]
+
+    if type_contrainte in ("pas_a_cote", "a_cote") and len(arguments) == 1:
+        return Contrainte(type_contrainte, (nom, arguments[0]))
+
+    if type_contrainte == "rangees" and len(arguments) == 1:
+        debut, _, fin = arguments[0].partition("-")
+        try:
+            bornes = (int(debut), int(fin or debut))
+        except ValueError:
+            raise ValueError(f"Rangées invalides : {arguments[0]}") from None
+        return Contrainte("rangees", (nom,), (min(bornes), max(bornes)))
+
+    if type_contrainte == "pres_bureau" and len(arguments) <= 1:
+        try:
+            distance = float(arguments[0]) if arguments else DISTANCE_BUREAU_DEFAUT
+        except ValueError:
+            raise ValueError(f"Distance invalide : {arguments[0]}") from None
+        return Contrainte("pres_bureau", (nom,), (distance,))
+
+    raise ValueError(f"Arguments invalides pour {type_contrainte} : {ligne.strip()}")
+
+
+def analyser(lignes: Iterable[str]) -> List[Contrainte]:
+    """
+    Analyse le contenu d'un fichier de contraintes.
+
+    Raises:
+        ValueError: si une ligne est mal formée (le numéro de ligne est indiqué).
+    """
+    contraintes: List[Contrainte] = []
+    for numero, ligne in enumerate(lignes, start=1):
+        try:
+            contrainte = analyser_ligne(ligne)
+        except ValueError as e:
+            raise ValueError(f"Ligne {numero} : {e}") from None
+        if contrainte is not None:
+            contraintes.append(contrainte)
+    return contraintes
+
+
+def chemin_contraintes(chemin_csv: str) -> str:
+    """Retourne le chemin du fichier de contraintes associé à un export Pronote (même nom, autre extension)."""
+    return os.path.splitext(chemin_csv)[0] + EXTENSION_CONTRAINTES
+
+
+def charger_contraintes(chemin_csv: str) -> List[Contrainte]:
+    """
+    Charge les contraintes rangées à côté d'un export Pronote (classe.csv → classe.contraintes).
+
+    Returns:
+        Les contraintes, ou une liste vide si le fichier n'existe pas.
+    """
+    chemin = chemin_contraintes(chemin_csv)
+    if not os.path.exists(chemin):
+        return []
+    with open(chemin, encoding="utf-8") as f:
+        return analyser(f)
+
+
+def indexer_noms(eleves: List[Eleve]) -> Callable[[str], int]:
+    """
+    Retourne une fonction donnant l'indice d'un élève (dans `eleves`) à partir du nom
+    écrit dans une contrainte. Le nom exact est prioritaire ; sinon la casse et les
+    espaces multiples sont ignorés.
+
+    La fonction renvoyée lève ValueError si le nom est inconnu.
+    """
+    par_nom: Dict[str, int] = {eleve.get_nom(): e for e, eleve in enumerate(eleves)}
+    par_nom_normalise: Dict[str, int] = {
+        " ".join(eleve.get_nom().casefold().split()): e for e, eleve in enumerate(eleves)
+    }
+
+    def indice(nom: str) -> int:
+        if nom in par_nom:
+            return par_nom[nom]
+        normalise = " ".join(nom.casefold().split())
+        if normalise in par_nom_normalise:
+            return par_nom_normalise[normalise]
+        raise ValueError(f"Élève inconnu dans les contraintes : {nom}")
+
+    return indice
+
+
+class ContraintesCompilees:
+    """
+    Contraintes traduites en prédicats sur des indices d'élèves et de sièges.
+
+    Les élèves sont repérés par leur indice dans la liste fournie, les sièges par leur
+    indice dans `Salle.get_sieges()`. Chaque prédicat est indexé par les élèves et les
+    sièges dont il dépend : après un échange, seuls les prédicats concernés sont
+    réévalués (voir `delta_echange`).
+    """
+
+    def __init__(self, contraintes: Sequence[Contrainte], salle: Salle, eleves: List[Eleve]) -> None:
+        """
+        Args:
+            contraintes: Les contraintes à compiler.
+            salle: La salle (les indices de sièges suivent `Salle.get_sieges()`).
+            eleves: Les élèves (leur indice dans cette liste sert d'identifiant).
+
+        Raises:
+            ValueError: si une contrainte cite un élève inconnu.
+        """
+        self.eleves: List[Eleve] = eleves
+        self.sieges: List[Siege] = salle.get_sieges()
+        self._indices_sieges: Dict[Siege, int] = {siege: s for s, siege in enumerate(self.sieges)}
+
+        voisins = sieges_voisins(salle)
+        self._voisins: List[Tuple[int, ...]] = [
+            tuple(self._indices_sieges[v] for v in voisins[siege]) for siege in self.sieges
+        ]
+        self._rangees: List[int] = [y for _, y, _ in self.sieges]
+        self._distances_bureau: List[float] = distances_bureau(salle)
+        self._genres: List[str] = [eleve.get_genre() for eleve in eleves]
+
+        self._indice_eleve: Callable[[str], int] = indexer_noms(eleves)
+
+        self._predicats: List[Predicat] = []
+        self._libelles: List[str] = []
+        self._par_eleve: List[List[int]] = [[] for _ in eleves]
+        self._par_siege: List[List[int]] = [[] for _ in self.sieges]
+        for contrainte in contraintes:
+            self._compiler(contrainte)
+
+    def __len__(self) -> int:
+        return len(self._predicats)
+
+    # -------------------------- Compilation --------------------------
+
+    def _ajouter(self, predicat: Predicat, libelle: str, eleves: Iterable[int] = (),
+                 sieges: Iterable[int] = ()) -> None:
+        p = len(self._predicats)
+        self._predicats.append(predicat)
+        self._libelles.append(libelle)
+        for e in eleves:
+            self._par_eleve[e].append(p)
+        for s in sieges:
+            self._par_siege[s].append(p)
+
+    def _compiler(self, contrainte: Contrainte) -> None:
+        voisins = self._voisins
+        libelle = str(contrainte)
+
+        if contrainte.type in ("pas_a_cote", "a_cote"):
+            a, b = (self._indice_eleve(nom) for nom in contrainte.noms)
+            if contrainte.type == "pas_a_cote":
+                def predicat(pos: List[int], occ: List[int], a: int = a, b: int = b) -> bool:
+                    return pos[a] >= 0 and pos[b] >= 0 and pos[b] in voisins[pos[a]]
+            else:
+                def predicat(pos: List[int], occ: List[int], a: int = a, b: int = b) -> bool:
+                    return pos[a] >= 0 and pos[b] >= 0 and pos[b] not in voisins[pos[a]]
+            self._ajouter(predicat, libelle, eleves=(a, b))
+
+        elif contrainte.type in ("rangees", "pres_bureau"):
+            e = self._indice_eleve(contrainte.noms[0])
+            if contrainte.type == "rangees":
+                debut, fin = contrainte.parametres
+                autorises = frozenset(s for s, y in enumerate(self._rangees) if debut <= y <= fin)
+            else:
+                distance = contrainte.parametres[0]
+                autorises = frozenset(s for s, d in enumerate(self._distances_bureau) if d <= distance)
+
+            def predicat(pos: List[int], occ: List[int], e: int = e) -> bool:
+                return pos[e] >= 0 and pos[e] not in autorises
+            self._ajouter(predicat, libelle, eleves=(e,))
+
+        elif contrainte.type == "alterner_genre":
+            # Un prédicat par paire de places voisines, indexé par ces deux places.
+            genres = self._genres
+            for s, voisins_s in enumerate(voisins):
+                for t in voisins_s:
+                    if t <= s:
+                        continue
+
+                    def predicat(pos: List[int], occ: List[int], s: int = s, t: int = t) -> bool:
+                        return occ[s] >= 0 and occ[t] >= 0 and genres[occ[s]] == genres[occ[t]]
+                    self._ajouter(predicat, f"{libelle} {self.sieges[s]}-{self.sieges[t]}", sieges=(s, t))
+
+    # -------------------------- Évaluation --------------------------
+
+    def etat(self, affectation: Affectation) -> Tuple[List[int], List[int]]:
+        """
+        Convertit une affectation en tableaux d'indices (positions, occupants).
+        """
+        positions = [-1] * len(self.eleves)
+        occupants = [-1] * len(self.sieges)
+        for e, eleve in enumerate(self.eleves):
+            if eleve in affectation:
+                s = self._indices_sieges[affectation[eleve]]
+                positions[e] = s
+                occupants[s] = e
+        return positions, occupants
+
+    def nb_violations(self, positions: List[int], occupants: List[int]) -> int:
+        """Retourne le nombre total de contraintes violées."""
+        return sum(1 for predicat in self._predicats if predicat(positions, occupants))
+
+    def violations(self, positions: List[int], occupants: List[int]) -> List[str]:
+        """Retourne la description des contraintes violées."""
+        return [libelle for predicat, libelle in zip(self._predicats, self._libelles)
+                if predicat(positions, occupants)]
+
+    def concernes(self, eleves: Iterable[int] = (), sieges: Iterable[int] = ()) -> Set[int]:
+        """Retourne les indices des prédicats qui dépendent des élèves ou sièges donnés."""
+        predicats: Set[int] = set()
+        for e in eleves:
+            predicats.update(self._par_eleve[e])
+        for s in sieges:
+            predicats.update(self._par_siege[s])
+        return predicats
+
+    def nb_violations_parmi(self, predicats: Iterable[int], positions: List[int], occupants: List[int]) -> int:
+        """Retourne le nombre de violations parmi les prédicats donnés."""
+        return sum(1 for p in predicats if self._predicats[p](positions, occupants))
+
+    def delta_echange(self, s1: int, s2: int, positions: List[int], occupants: List[int]) -> int:
+        """
+        Variation du nombre de violations si l'on échange le contenu des sièges s1 et s2
+        (l'un des deux peut être vide). Les tableaux sont restaurés avant le retour.
+        """
+        e1, e2 = occupants[s1], occupants[s2]
+        predicats = self.concernes([e for e in (e1, e2) if e >= 0], (s1, s2))
+        avant = self.nb_violations_parmi(predicats, positions, occupants)
+        self.echanger(s1, s2, positions, occupants)
+        apres = self.nb_violations_parmi(predicats, positions, occupants)
+        self.echanger(s1, s2, positions, occupants)
+        return apres - avant
+
+    @staticmethod
+    def echanger(s1: int, s2: int, positions: List[int], occupants: List[int]) -> None:
+        """Échange le contenu des sièges s1 et s2 dans les tableaux (positions, occupants)."""
+        e1, e2 = occupants[s1], occupants[s2]
+        occupants[s1], occupants[s2] = e2, e1
+        if e1 >= 0:
+            positions[e1] = s2
+        if e2 >= 0:
+            positions[e2] = s1
+
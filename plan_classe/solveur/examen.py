@@ -0,0 +1,224 @@
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from plan_classe.model.eleve import Eleve
+from plan_classe.model.salle import Salle
+from plan_classe.solveur.base import Affectation, Siege, Solveur, verifier_noms_uniques
+
+
+class SolveurSalleExamen(Solveur):
+    """
+    Place des candidats dans une seule salle d'examen.
+
+    Les places utilisables respectent les règles d'espacement (places vides entre deux
+    candidats d'une même table, rangées laissées vides). Lorsque plusieurs classes sont
+    mélangées, on évite que deux voisins (côte à côte ou l'un devant l'autre) soient
+    de la même classe.
+    """
+
+    def __init__(self, espacement: int = 1, espacement_rangees: int = 0, melanger_classes: bool = True) -> None:
+        """
+        Args:
+            espacement: Nombre de places laissées vides entre deux candidats sur une même table.
+            espacement_rangees: Nombre de rangées laissées vides entre deux rangées de candidats.
+            melanger_classes: Si True, alterne les classes entre places voisines ;
+                              sinon, place les candidats par ordre alphabétique.
+        """
+        if espacement < 0 or espacement_rangees < 0:
+            raise ValueError("Les espacements doivent être positifs ou nuls")
+        self._espacement: int = espacement
+        self._espacement_rangees: int = espacement_rangees
+        self._melanger_classes: bool = melanger_classes
+
+    def places_utilisables(self, salle: Salle) -> List[Siege]:
+        """
+        Retourne les places de la salle utilisables pour l'examen, de l'avant vers le fond
+        puis de gauche à droite.
+
+        Une place est utilisable si elle est libre (valide et inoccupée), sur une rangée
+        retenue, et à distance suffisante du candidat précédent de la même table.
+        """
+        places: List[Siege] = []
+        tables = sorted(salle.get_tables(), key=lambda t: (t.get_position()[1], t.get_position()[0]))
+        for table in tables:
+            x, y = table.get_position()
+            if y % (self._espacement_rangees + 1) != 0:
+                continue
+            derniere: Optional[int] = None
+            for i in range(table.get_capacite()):
+                if not table.est_libre(i):
+                    continue
+                if derniere is not None and i - derniere <= self._espacement:
+                    continue
+                places.append((x, y, i))
+                derniere = i
+        return places
+
+    def melange_classes(self) -> bool:
+        """Indique si le solveur mélange les classes."""
+        return self._melanger_classes
+
+    def capacite(self, salle: Salle) -> int:
+        """Retourne le nombre de candidats que la salle peut accueillir."""
+        return len(self.places_utilisables(salle))
+
+    def resoudre(self, salle: Salle, eleves: List[Eleve]) -> Affectation:
+        """
+        Attribue une place utilisable à chaque candidat.
+
+        Raises:
+            ValueError: si la salle n'a pas assez de places utilisables, ou si deux
+                        candidats portent le même nom (ils seraient confondus dans
+                        l'affectation : utiliser `placer`).
+        """
+        verifier_noms_uniques(eleves)
+        return dict(zip(eleves, self.placer(salle, eleves)))
+
+    def placer(self, salle: Salle, eleves: List[Eleve]) -> List[Siege]:
+        """
+        Attribue une place utilisable à chaque candidat, sans indexer par élève : deux
+        candidats de même nom sont deux candidats distincts.
+
+        Returns:
+            La place de chaque candidat, dans l'ordre de `eleves`.
+
+        Raises:
+            ValueError: si la salle n'a pas assez de places utilisables.
+        """
+        places = self.places_utilisables(salle)
+        if len(eleves) > len(places):
+            raise ValueError(f"Salle trop petite : {len(eleves)} candidats pour {len(places)} places")
+
+        ordre = sorted(range(len(eleves)), key=lambda k: eleves[k])
+        if not self._melanger_classes:
+            sieges = dict(zip(ordre, places))
+            return [sieges[k] for k in range(len(eleves))]
+
+        restants: Dict[str, List[int]] = defaultdict(list)
+        for k in reversed(ordre):
+            restants[eleves[k].get_classe()].append(k)
+
+        sieges: Dict[int, Siege] = {}
+        classe_par_siege: Dict[Siege, str] = {}
+        precedent: Optional[Siege] = None
+        for siege in places[:len(eleves)]:
+            x, y, i = siege
+            voisines: Set[str] = set()
+            if precedent is not None and precedent[1] == y:
+                voisines.add(classe_par_siege[precedent])
+            # Candidat assis juste devant (même table, même place, rangée retenue précédente)
+            devant: Siege = (x, y - self._espacement_rangees - 1, i)
+            if devant in classe_par_siege:
+                voisines.add(classe_par_siege[devant])
+
+            candidates = [c for c in restants if restants[c]]
+            autorisees = [c for c in candidates if c not in voisines] or candidates
+            classe = max(autorisees, key=lambda c: (len(restants[c]), c))
+
+            sieges[restants[classe].pop()] = siege
+            classe_par_siege[siege] = classe
+            precedent = siege
+        return [sieges[k] for k in range(len(eleves))]
+
+
+def _placer_salle(solveur: SolveurSalleExamen, salle: Salle, eleves: List[Eleve]) -> List[Siege]:
+    """Point d'entrée d'un processus de travail : place les candidats d'une salle."""
+    return solveur.placer(salle, eleves)
+
+
+class RepartiteurExamen:
+    """
+    Répartit un grand nombre de candidats sur plusieurs salles d'examen.
+
+    La répartition se fait en deux temps : un découpage global de la liste des candidats
+    selon la capacité de chaque salle, puis le placement dans chaque salle, en parallèle
+    (un processus par salle).
+    """
+
+    def __init__(self, salles: List[Salle], solveur: Optional[SolveurSalleExamen] = None) -> None:
+        """
+        Args:
+            salles: Les salles disponibles, remplies dans cet ordre.
+            solveur: Le solveur utilisé pour chaque salle (par défaut : une place vide
+                     entre deux candidats et classes mélangées).
+        """
+        self._salles: List[Salle] = salles
+        self._solveur: SolveurSalleExamen = solveur if solveur is not None else SolveurSalleExamen()
+
+    def decouper(self, eleves: List[Eleve]) -> List[List[Eleve]]:
+        """
+        Découpe la liste des candidats en une partition par salle.
+
+        Avec mélange des classes, chaque classe est étalée uniformément sur l'ensemble des
+        candidats avant découpage, de sorte que chaque salle reçoive un mélange proportionnel.
+        Sinon, les salles sont remplies dans l'ordre alphabétique. Le découpage porte sur
+        les positions dans la liste : des homonymes sont des candidats distincts.
+
+        Raises:
+            ValueError: si la capacité totale des salles est insuffisante.
+        """
+        return [[eleves[k] for k in partie] for partie in self._decouper_indices(eleves)]
+
+    def _decouper_indices(self, eleves: List[Eleve]) -> List[List[int]]:
+        """Comme `decouper`, mais renvoie les indices des candidats dans `eleves`."""
+        capacites = [self._solveur.capacite(salle) for salle in self._salles]
+        if len(eleves) > sum(capacites):
+            raise ValueError(f"Capacité insuffisante : {len(eleves)} candidats pour {sum(capacites)} places")
+
+        alphabetique = sorted(range(len(eleves)), key=lambda k: eleves[k])
+        if self._solveur.melange_classes():
+            par_classe: Dict[str, List[int]] = defaultdict(list)
+            for k in alphabetique:
+                par_classe[eleves[k].get_classe()].append(k)
+            # Rang relatif de chaque élève dans sa classe, entre 0 et 1
+            rang: List[float] = [0.0] * len(eleves)
+            for liste in par_classe.values():
+                for position, k in enumerate(liste):
+                    rang[k] = (position + 0.5) / len(liste)
+            ordre = sorted(range(len(eleves)), key=lambda k: (rang[k], eleves[k].get_classe()))
+        else:
+            ordre = alphabetique
+
+        partitions: List[List[int]] = []
+        debut = 0
+        for capacite in capacites:
+            partitions.append(ordre[debut:debut + capacite])
+            debut += capacite
+        return partitions
+
+    def repartir(self, eleves: List[Eleve], parallele: bool = True) -> List[List[Tuple[Eleve, Siege]]]:
+        """
+        Répartit les candidats dans les salles et les y place.
+
+        Les candidats sont repérés par leur position dans `eleves` : deux homonymes sont
+        placés chacun de leur côté. Le résultat est donc une liste de couples plutôt
+        qu'une `Affectation` (où ils seraient confondus).
+
+        Args:
+            eleves: Tous les candidats.
+            parallele: Si True, résout chaque salle dans un processus séparé.
+
+        Returns:
+            Pour chaque salle (dans l'ordre des salles), les couples (candidat, place) de
+            ses candidats. Les candidats sont les objets de `eleves`, pas des copies.
+        """
+        partitions = self._decouper_indices(eleves)
+        parties = [[eleves[k] for k in partie] for partie in partitions]
+
+        if parallele and sum(1 for partie in parties if partie) > 1:
+            with ProcessPoolExecutor(max_workers=len(parties)) as executeur:
+                resultats = list(executeur.map(
+                    _placer_salle, [self._solveur] * len(parties), self._salles, parties))
+        else:
+            resultats = [self._solveur.placer(salle, partie) for salle, partie in zip(self._salles, parties)]
+
+        # Les élèves envoyés aux processus sont copiés : seules les places reviennent,
+        # et elles sont rattachées aux originaux par leur indice.
+        repartition: List[List[Tuple[Eleve, Siege]]] = []
+        for salle, partie, sieges in zip(self._salles, partitions, resultats):
+            placements = [(eleves[k], siege) for k, siege in zip(partie, sieges)]
+            for eleve, (x, y, i) in placements:
+                salle.get_table(x, y).placer_eleve(eleve, i)
+            repartition.append(placements)
+        return repartition
@@ -0,0 +1,152 @@
+from typing import Callable, Dict, List, Optional, Set
+
+from plan_classe.model.eleve import Eleve
+from plan_classe.model.salle import Salle
+from plan_classe.solveur.base import Affectation, Siege, affectation_courante, places_libres
+
+
+def distance_sieges(a: Siege, b: Siege) -> float:
+    """
+    Distance entre deux places : changer de rangée ou de colonne coûte 1,
+    se décaler d'une place sur la même table coûte 0,5.
+    """
+    return abs(a[0] - b[0]) + abs(a[1] - b[1]) + 0.5 * abs(a[2] - b[2])
+
+
+class Reparateur:
+    """
+    Met à jour un plan existant après une petite modification (élève fixé ou déplacé
+    à la main, place désactivée, etc.) sans tout recalculer.
+
+    Seul le voisinage des places modifiées est ré-optimisé : les élèves déplacés et ceux
+    assis à proximité peuvent changer de place, le reste du plan ne bouge pas. Le coût
+    d'une place pour un élève est la distance à son ancienne place, à laquelle s'ajoute
+    une pénalité optionnelle.
+    """
+
+    def __init__(
+            self,
+            rayon: int = 1,
+            poids_deplacement: float = 1.0,
+            penalite: Optional[Callable[[Eleve, Siege], float]] = None
+    ) -> None:
+        """
+        Args:
+            rayon: Rayon du voisinage ré-optimisé, en tables (colonnes et rangées).
+            poids_deplacement: Coût d'un déplacement d'une unité de distance.
+            penalite: Pénalité supplémentaire pour un élève sur une place donnée.
+        """
+        self._rayon: int = rayon
+        self._poids_deplacement: float = poids_deplacement
+        self._penalite: Optional[Callable[[Eleve, Siege], float]] = penalite
+
+    def reparer(self, salle: Salle, precedente: Affectation) -> Affectation:
+        """
+        Répare le plan de la salle après modification et applique le résultat.
+
+        La modification est déduite en comparant la salle à l'affectation précédente :
+        les élèves qui n'ont plus de place, ou qui sont assis sur une place désactivée
+        (`Table.invalider`), sont à replacer ; ces places et celles dont l'occupant a changé
+        définissent la zone à ré-optimiser. Les élèves fixés (`Eleve.fixer`) ne bougent
+        jamais, sauf s'ils sont assis sur une place désactivée. Si la zone ne suffit pas,
+        elle est élargie ; si la salle entière ne suffit pas, les élèves en trop restent
+        sans place.
+
+        Args:
+            salle: La salle, dans son état modifié.
+            precedente: L'affectation avant modification.
+
+        Returns:
+            La nouvelle affectation complète de la salle.
+        """
+        # Un élève resté sur une place désactivée doit la quitter.
+        chasses: Affectation = {}
+        for table in salle.get_tables():
+            x, y = table.get_position()
+            for i, eleve in enumerate(table.get_places()):
+                if eleve is not None and not table.est_valide(i):
+                    table.liberer_place(i)
+                    chasses[eleve] = (x, y, i)
+
+        courante = affectation_courante(salle)
+        sans_place: List[Eleve] = sorted(set(e for e in precedente if e not in courante) | set(chasses))
+
+        touchees: Set[Siege] = set(chasses.values())
+        touchees |= {precedente[e] for e in precedente if courante.get(e) != precedente[e]}
+        touchees |= {courante[e] for e in courante if precedente.get(e) != courante[e]}
+        if not touchees:
+            return courante
+
+        libres_salle: Set[Siege] = set(places_libres(salle))
+        occupant: Dict[Siege, Eleve] = {siege: eleve for eleve, siege in courante.items()}
+        toutes = salle.get_sieges()
+
+        rayon = self._rayon
+        while True:
+            zone = [s for s in toutes if any(
+                abs(s[0] - t[0]) <= rayon and abs(s[1] - t[1]) <= rayon for t in touchees)]
+            mobiles = sans_place + sorted(
+                occupant[s] for s in zone if s in occupant and not occupant[s].est_fixe())
+            places = [s for s in zone if s in libres_salle or (s in occupant and not occupant[s].est_fixe())]
+            if len(mobiles) <= len(places) or len(zone) == len(toutes):
+                break
+            rayon += 1
+
+        # Place de référence : place actuelle, sinon place quittée
+        reference: Dict[Eleve, Siege] = {e: courante.get(e) or chasses.get(e) or precedente[e] for e in mobiles}
+        nouvelle = self._optimiser(mobiles, places, reference)
+
+        for eleve in mobiles:
+            if eleve in courante:
+                x, y, i = courante[eleve]
+                salle.get_table(x, y).liberer_place(i)
+        for eleve, (x, y, i) in nouvelle.items():
+            salle.get_table(x, y).placer_eleve(eleve, i)
+
+        resultat = {e: s for e, s in courante.items() if e not in reference}
+        resultat.update(nouvelle)
+        return resultat
+
+    def _cout(self, eleve: Eleve, siege: Siege, reference: Dict[Eleve, Siege]) -> float:
+        cout = self._poids_deplacement * distance_sieges(reference[eleve], siege)
+        if self._penalite is not None:
+            cout += self._penalite(eleve, siege)
+        return cout
+
+    def _optimiser(self, mobiles: List[Eleve], places: List[Siege], reference: Dict[Eleve, Siege]) -> Affectation:
+        """
+        Affecte les élèves mobiles aux places de la zone : placement glouton par coût
+        croissant, puis échanges deux à deux (y compris avec une place vide) tant qu'ils
+        font baisser le coût total.
+        """
+        couts = {(e, s): self._cout(e, s, reference) for e in mobiles for s in places}
+
+        affectation: Affectation = {}
+        prises: Set[Siege] = set()
+        for e, s in sorted(couts, key=lambda cle: (couts[cle], cle[0], cle[1])):
+            if e not in affectation and s not in prises:
+                affectation[e] = s
+                prises.add(s)
+
+        occupants: List[Optional[Eleve]] = [None] * len(places)
+        indices = {s: k for k, s in enumerate(places)}
+        for e, s in affectation.items():
+            occupants[indices[s]] = e
+
+        def cout_place(k: int, e: Optional[Eleve]) -> float:
+            return 0.0 if e is None else couts[(e, places[k])]
+
+        ameliore = True
+        while ameliore:
+            ameliore = False
+            for a in range(len(places)):
+                for b in range(a + 1, len(places)):
+                    ea, eb = occupants[a], occupants[b]
+                    if ea is None and eb is None:
+                        continue
+                    delta = (cout_place(a, eb) + cout_place(b, ea)) - (cout_place(a, ea) + cout_place(b, eb))
+                    if delta < -1e-9:
+                        occupants[a], occupants[b] = eb, ea
+                        ameliore = True
+
+        return {e: places[k] for k, e in enumerate(occupants) if e is not None}
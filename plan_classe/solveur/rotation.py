@@ -0,0 +1,222 @@
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from plan_classe.model.eleve import Eleve
+from plan_classe.model.salle import Salle
+from plan_classe.solveur.base import (Affectation, Siege, Solveur, places_valides, sieges_voisins,
+                                     verifier_noms_uniques)
+from plan_classe.solveur.contraintes import Contrainte, ContraintesCompilees
+
+# Contraintes compilées et leur état (positions, occupants) tenu à jour pendant la recherche
+EtatContraintes = Tuple[ContraintesCompilees, List[int], List[int]]
+
+
+class PlanificateurRotation:
+    """
+    Génère une suite de plans pour une même salle et une même classe (par exemple un
+    plan toutes les trois semaines sur un trimestre).
+
+    Chaque plan pénalise les voisinages déjà vécus dans les plans précédents, les
+    passages répétés au fond de la salle et, le cas échéant, les contraintes violées.
+    Les plans sont optimisés l'un après l'autre par recuit simulé (échanges de places),
+    chacun partant du plan précédent.
+    """
+
+    def __init__(
+            self,
+            salle: Salle,
+            poids_voisins: float = 1.0,
+            poids_fond: float = 1.0,
+            nb_rangees_fond: int = 2,
+            iterations: Optional[int] = None,
+            graine: Optional[int] = None,
+            solveur_initial: Optional[Solveur] = None,
+            contraintes: Sequence[Contrainte] = (),
+            poids_contraintes: float = 10.0
+    ) -> None:
+        """
+        Args:
+            salle: La salle. Toutes ses places valides sont utilisées, même occupées : les
+                   plans produits sont destinés à remplacer le plan en place.
+            poids_voisins: Pénalité par voisinage déjà vécu (cumulée à chaque répétition).
+            poids_fond: Pénalité par passage déjà effectué au fond de la salle.
+            nb_rangees_fond: Nombre de rangées considérées comme « le fond ».
+            iterations: Nombre d'échanges essayés par plan (par défaut : 200 par place).
+            graine: Graine du générateur aléatoire, pour des suites reproductibles.
+            solveur_initial: Solveur produisant le premier plan (par défaut : placement
+                             aléatoire sur les places valides).
+            contraintes: Contraintes à respecter (voir `plan_classe.solveur.contraintes`).
+            poids_contraintes: Pénalité par contrainte violée.
+        """
+        self._salle: Salle = salle
+        self._poids_voisins: float = poids_voisins
+        self._poids_fond: float = poids_fond
+        self._rng: random.Random = random.Random(graine)
+        self._solveur_initial: Optional[Solveur] = solveur_initial
+        self._contraintes: Sequence[Contrainte] = contraintes
+        self._poids_contraintes: float = poids_contraintes
+
+        self._places: List[Siege] = places_valides(salle)
+        # Indice de chaque place dans `Salle.get_sieges()`, utilisé par les contraintes compilées
+        indices_salle: Dict[Siege, int] = {siege: s for s, siege in enumerate(salle.get_sieges())}
+        self._indices_salle: List[int] = [indices_salle[siege] for siege in self._places]
+        indices: Dict[Siege, int] = {siege: k for k, siege in enumerate(self._places)}
+        voisins = sieges_voisins(salle)
+        self._voisins: List[List[int]] = [
+            [indices[v] for v in voisins[siege] if v in indices] for siege in self._places
+        ]
+        rangee_max = max((y for _, y, _ in self._places), default=0)
+        self._fond: Set[int] = {
+            k for k, (_, y, _) in enumerate(self._places) if y > rangee_max - nb_rangees_fond
+        }
+        self._iterations: int = iterations if iterations is not None else 200 * len(self._places)
+
+    def planifier(self, eleves: List[Eleve], nb_plans: int, depart: Optional[Affectation] = None) -> List[Affectation]:
+        """
+        Génère `nb_plans` plans successifs.
+
+        Args:
+            eleves: Les élèves à placer.
+            nb_plans: Nombre de plans à produire.
+            depart: Plan actuellement en place, le cas échéant (par exemple
+                    `affectation_courante(salle)`). Il compte dans l'historique et sert de
+                    point de départ au premier plan ; les élèves qu'il ne place pas
+                    reçoivent une place libre au hasard.
+
+        Returns:
+            Les plans, dans l'ordre où ils doivent être utilisés.
+
+        Raises:
+            ValueError: si la salle n'a pas assez de places valides, si deux élèves portent
+                        le même nom, si le plan de départ utilise une place non valide, ou
+                        si une contrainte cite un élève inconnu.
+        """
+        verifier_noms_uniques(eleves)
+        if len(eleves) > len(self._places):
+            raise ValueError(f"Salle trop petite : {len(eleves)} élèves pour {len(self._places)} places")
+
+        historique_voisins: Dict[Tuple[int, int], int] = {}
+        historique_fond: List[int] = [0] * len(eleves)
+
+        if depart is not None:
+            initial = depart
+        elif self._solveur_initial is not None:
+            initial = self._solveur_initial.resoudre(self._salle, eleves)
+        else:
+            initial = {}
+        occupants = self._occupants_initiaux(eleves, initial)
+        if depart is not None:
+            self._memoriser(occupants, historique_voisins, historique_fond)
+
+        etat_contraintes: Optional[EtatContraintes] = None
+        if self._contraintes:
+            compilees = ContraintesCompilees(self._contraintes, self._salle, eleves)
+            etat_contraintes = (compilees, *compilees.etat(
+                {eleves[e]: self._places[k] for k, e in enumerate(occupants) if e >= 0}))
+
+        plans: List[Affectation] = []
+        for _ in range(nb_plans):
+            self._optimiser(occupants, historique_voisins, historique_fond, etat_contraintes)
+            self._memoriser(occupants, historique_voisins, historique_fond)
+            plans.append({eleves[e]: self._places[k] for k, e in enumerate(occupants) if e >= 0})
+        return plans
+
+    def _occupants_initiaux(self, eleves: List[Eleve], initial: Affectation) -> List[int]:
+        """
+        Traduit un plan de départ en tableau d'occupants ; les élèves qu'il ne place pas
+        sont répartis au hasard sur les places restantes.
+
+        Raises:
+            ValueError: si le plan place un élève sur une place non valide de la salle.
+        """
+        indices_places: Dict[Siege, int] = {siege: k for k, siege in enumerate(self._places)}
+        occupants: List[int] = [-1] * len(self._places)
+        sans_place: List[int] = []
+        for e, eleve in enumerate(eleves):
+            siege = initial.get(eleve)
+            if siege is None:
+                sans_place.append(e)
+            elif siege not in indices_places or occupants[indices_places[siege]] >= 0:
+                raise ValueError(f"Place de départ {siege} invalide pour {eleve.get_nom()}")
+            else:
+                occupants[indices_places[siege]] = e
+
+        libres = [k for k, e in enumerate(occupants) if e < 0]
+        for e, k in zip(sans_place, self._rng.sample(libres, len(sans_place))):
+            occupants[k] = e
+        return occupants
+
+    def _cout_place(
+            self,
+            k: int,
+            occupants: List[int],
+            historique_voisins: Dict[Tuple[int, int], int],
+            historique_fond: List[int]
+    ) -> float:
+        """Pénalité due à l'élève assis à la place d'indice k (0 si la place est vide)."""
+        e = occupants[k]
+        if e < 0:
+            return 0.0
+        cout = self._poids_fond * historique_fond[e] if k in self._fond else 0.0
+        for v in self._voisins[k]:
+            f = occupants[v]
+            if f >= 0:
+                cout += self._poids_voisins * historique_voisins.get((min(e, f), max(e, f)), 0)
+        return cout
+
+    def _optimiser(
+            self,
+            occupants: List[int],
+            historique_voisins: Dict[Tuple[int, int], int],
+            historique_fond: List[int],
+            etat_contraintes: Optional[EtatContraintes] = None
+    ) -> None:
+        """
+        Améliore le plan courant sur place par recuit simulé sur des échanges de places.
+        Avec des contraintes, leur état est tenu à jour en même temps que `occupants`.
+        """
+        n = len(occupants)
+        if n < 2:
+            return
+        temperature_initiale = max(self._poids_voisins, self._poids_fond)
+        if etat_contraintes is not None:
+            temperature_initiale = max(temperature_initiale, self._poids_contraintes)
+        for iteration in range(self._iterations):
+            a, b = self._rng.sample(range(n), 2)
+            if occupants[a] == occupants[b]:  # deux places vides
+                continue
+            avant = (self._cout_place(a, occupants, historique_voisins, historique_fond)
+                     + self._cout_place(b, occupants, historique_voisins, historique_fond))
+            occupants[a], occupants[b] = occupants[b], occupants[a]
+            apres = (self._cout_place(a, occupants, historique_voisins, historique_fond)
+                     + self._cout_place(b, occupants, historique_voisins, historique_fond))
+            delta = apres - avant
+            if etat_contraintes is not None:
+                compilees, positions, occupants_salle = etat_contraintes
+                sa, sb = self._indices_salle[a], self._indices_salle[b]
+                delta += self._poids_contraintes * compilees.delta_echange(sa, sb, positions, occupants_salle)
+
+            temperature = temperature_initiale * (1 - iteration / self._iterations)
+            if delta > 0 and (temperature <= 0 or self._rng.random() >= math.exp(-delta / temperature)):
+                occupants[a], occupants[b] = occupants[b], occupants[a]  # échange refusé
+            elif etat_contraintes is not None:
+                compilees.echanger(sa, sb, positions, occupants_salle)
+
+    def _memoriser(
+            self,
+            occupants: List[int],
+            historique_voisins: Dict[Tuple[int, int], int],
+            historique_fond: List[int]
+    ) -> None:
+        """Ajoute le plan courant à l'historique des voisinages et des passages au fond."""
+        for k, e in enumerate(occupants):
+            if e < 0:
+                continue
+            if k in self._fond:
+                historique_fond[e] += 1
+            for v in self._voisins[k]:
+                f = occupants[v]
+                if v > k and f >= 0:
+                    paire = (min(e, f), max(e, f))
+                    historique_voisins[paire] = historique_voisins.get(paire, 0) + 1
@@ -0,0 +1,216 @@
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from plan_classe.model.eleve import Eleve
+from plan_classe.model.salle import Salle
+from plan_classe.solveur.base import Affectation, Siege, distances_bureau, sieges_voisins
+from plan_classe.solveur.contraintes import Contrainte, indexer_noms
+
+METRIQUES: Tuple[str, ...] = ("violations", "mixite_tables", "distance_bureau", "nouveaute_voisins")
+
+
+class EvaluateurPlans:
+    """
+    Évalue d'un seul coup de nombreux plans candidats pour une même salle et une même
+    liste d'élèves (départs multiples d'un solveur, plans des années précédentes, ...).
+
+    Un lot de B plans est un tableau (B, N) d'entiers : la case [b, e] contient l'indice
+    (dans `Salle.get_sieges()`) du siège de l'élève e dans le plan b, ou -1 s'il n'est
+    pas placé. Toutes les métriques sont calculées par opérations vectorisées sur ce
+    tableau, sans boucle sur les plans.
+
+    Métriques (une valeur par plan, plus petite = meilleure sauf mention contraire) :
+        violations          nombre de contraintes violées
+        mixite_tables       déséquilibre filles/garçons cumulé sur les tables (0 = parfait)
+        distance_bureau     distance moyenne au bureau des élèves placés
+        nouveaute_voisins   part des paires de voisins inédites par rapport à l'historique
+                            (plus grande = meilleure)
+    """
+
+    def __init__(
+            self,
+            salle: Salle,
+            eleves: List[Eleve],
+            contraintes: Sequence[Contrainte] = (),
+            historique: Sequence[Affectation] = ()
+    ) -> None:
+        """
+        Args:
+            salle: La salle commune à tous les plans.
+            eleves: Les élèves ; leur indice dans cette liste sert d'identifiant.
+            contraintes: Contraintes à vérifier (voir `plan_classe.solveur.contraintes`).
+            historique: Plans déjà utilisés, pour mesurer la nouveauté des voisinages.
+
+        Raises:
+            ValueError: si une contrainte cite un élève inconnu.
+        """
+        self.eleves: List[Eleve] = eleves
+        self.sieges: List[Siege] = salle.get_sieges()
+        self._indices_sieges: Dict[Siege, int] = {siege: s for s, siege in enumerate(self.sieges)}
+        nb_sieges = len(self.sieges)
+
+        # Géométrie de la salle, par indice de siège
+        self._distances_bureau: np.ndarray = np.array(distances_bureau(salle), dtype=float)
+        tables = {position: t for t, position in enumerate(sorted({(x, y) for x, y, _ in self.sieges}))}
+        self._appartenance: np.ndarray = np.zeros((nb_sieges, len(tables)), dtype=np.int64)
+        for s, (x, y, _) in enumerate(self.sieges):
+            self._appartenance[s, tables[(x, y)]] = 1
+
+        voisins = sieges_voisins(salle)
+        paires = [(s, self._indices_sieges[v]) for s, siege in enumerate(self.sieges)
+                  for v in voisins[siege] if self._indices_sieges[v] > s]
+        self._paires_voisines: np.ndarray = np.array(paires, dtype=np.int64).reshape(-1, 2)
+        self._adjacence: np.ndarray = np.zeros((nb_sieges, nb_sieges), dtype=bool)
+        self._adjacence[self._paires_voisines[:, 0], self._paires_voisines[:, 1]] = True
+        self._adjacence |= self._adjacence.T
+
+        # +1 pour F, -1 pour M, 0 sinon ; la dernière case sert aux places vides (indice -1).
+        signes = [1 if eleve.get_genre() == "F" else -1 if eleve.get_genre() == "M" else 0 for eleve in eleves]
+        self._signes_genre: np.ndarray = np.array(signes + [0], dtype=np.int64)
+        codes = {genre: c for c, genre in enumerate(sorted({eleve.get_genre() for eleve in eleves}))}
+        self._codes_genre: np.ndarray = np.array([codes[eleve.get_genre()] for eleve in eleves], dtype=np.int64)
+
+        self._compiler(contraintes, indexer_noms(eleves))
+
+        self._deja_voisins: np.ndarray = np.zeros((len(eleves), len(eleves)), dtype=bool)
+        if historique:
+            anciens = self.tableau(historique)
+            e1, e2 = self._paires_eleves(self._occupants(anciens))
+            presentes = (e1 >= 0) & (e2 >= 0)
+            self._deja_voisins[e1[presentes], e2[presentes]] = True
+            self._deja_voisins |= self._deja_voisins.T
+
+    def _compiler(self, contraintes: Sequence[Contrainte], indice: Callable[[str], int]) -> None:
+        """Range les contraintes par type dans des tableaux d'indices."""
+        separes, ensemble, zones_eleves, zones = [], [], [], []
+        self._alterner_genre: bool = False
+        rangees = np.array([y for _, y, _ in self.sieges])
+        for contrainte in contraintes:
+            if contrainte.type == "pas_a_cote":
+                separes.append([indice(nom) for nom in contrainte.noms])
+            elif contrainte.type == "a_cote":
+                ensemble.append([indice(nom) for nom in contrainte.noms])
+            elif contrainte.type == "rangees":
+                debut, fin = contrainte.parametres
+                zones_eleves.append(indice(contrainte.noms[0]))
+                zones.append((rangees >= debut) & (rangees <= fin))
+            elif contrainte.type == "pres_bureau":
+                zones_eleves.append(indice(contrainte.noms[0]))
+                zones.append(self._distances_bureau <= contrainte.parametres[0])
+            elif contrainte.type == "alterner_genre":
+                self._alterner_genre = True
+
+        self._separes: np.ndarray = np.array(separes, dtype=np.int64).reshape(-1, 2)
+        self._ensemble: np.ndarray = np.array(ensemble, dtype=np.int64).reshape(-1, 2)
+        self._zones_eleves: np.ndarray = np.array(zones_eleves, dtype=np.int64)
+        # Une colonne supplémentaire (toujours autorisée) pour les élèves non placés.
+        self._zones: np.ndarray = np.ones((len(zones), len(self.sieges) + 1), dtype=bool)
+        if zones:
+            self._zones[:, :-1] = np.array(zones)
+
+    # -------------------------- Conversion --------------------------
+
+    def tableau(self, affectations: Sequence[Affectation]) -> np.ndarray:
+        """Convertit des affectations en un lot (B, N) d'indices de sièges."""
+        lot = np.full((len(affectations), len(self.eleves)), -1, dtype=np.int64)
+        for b, affectation in enumerate(affectations):
+            for e, eleve in enumerate(self.eleves):
+                siege = affectation.get(eleve)
+                if siege is not None:
+                    lot[b, e] = self._indices_sieges[siege]
+        return lot
+
+    def _occupants(self, lot: np.ndarray) -> np.ndarray:
+        """Inverse un lot : tableau (B, S) de l'indice de l'élève assis sur chaque siège (-1 si vide)."""
+        occupants = np.full((lot.shape[0], len(self.sieges)), -1, dtype=np.int64)
+        plans, eleves = np.nonzero(lot >= 0)
+        occupants[plans, lot[plans, eleves]] = eleves
+        return occupants
+
+    def _paires_eleves(self, occupants: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Élèves assis sur chaque paire de places voisines : deux tableaux (B, P)."""
+        return occupants[:, self._paires_voisines[:, 0]], occupants[:, self._paires_voisines[:, 1]]
+
+    # -------------------------- Métriques --------------------------
+
+    def _violations(self, lot: np.ndarray, occupants: np.ndarray) -> np.ndarray:
+        violations = np.zeros(lot.shape[0], dtype=np.int64)
+
+        for paires, voisins_attendus in ((self._separes, False), (self._ensemble, True)):
+            if len(paires):
+                pa, pb = lot[:, paires[:, 0]], lot[:, paires[:, 1]]
+                places = (pa >= 0) & (pb >= 0)
+                voisins = self._adjacence[pa, pb]
+                violations += (places & (voisins != voisins_attendus)).sum(axis=1)
+
+        if len(self._zones_eleves):
+            positions = lot[:, self._zones_eleves]  # (B, K) ; -1 désigne la colonne « non placé »
+            autorise = self._zones[np.arange(len(self._zones_eleves)), positions]
+            violations += (~autorise).sum(axis=1)
+
+        if self._alterner_genre and len(self._paires_voisines):
+            e1, e2 = self._paires_eleves(occupants)
+            places = (e1 >= 0) & (e2 >= 0)
+            memes = self._codes_genre[np.maximum(e1, 0)] == self._codes_genre[np.maximum(e2, 0)]
+            violations += (places & memes).sum(axis=1)
+
+        return violations
+
+    def _mixite_tables(self, occupants: np.ndarray) -> np.ndarray:
+        signes = self._signes_genre[occupants]  # -1 indexe la case « place vide » (0)
+        equilibre = signes @ self._appartenance  # (B, T) : nb de F - nb de M par table
+        effectifs = (signes != 0).astype(np.int64) @ self._appartenance  # élèves F ou M par table
+        # Une table à effectif F/M impair ne peut pas faire mieux qu'un écart de 1.
+        return (np.abs(equilibre) - effectifs % 2).sum(axis=1)
+
+    def _distance_bureau(self, lot: np.ndarray) -> np.ndarray:
+        places = lot >= 0
+        distances = np.where(places, self._distances_bureau[np.maximum(lot, 0)], 0.0)
+        nb_places = places.sum(axis=1)
+        return np.divide(distances.sum(axis=1), nb_places, out=np.zeros(lot.shape[0]), where=nb_places > 0)
+
+    def _nouveaute_voisins(self, occupants: np.ndarray) -> np.ndarray:
+        if not len(self._paires_voisines):
+            return np.ones(occupants.shape[0])
+        e1, e2 = self._paires_eleves(occupants)
+        places = (e1 >= 0) & (e2 >= 0)
+        deja = places & self._deja_voisins[np.maximum(e1, 0), np.maximum(e2, 0)]
+        nb_paires = places.sum(axis=1)
+        return 1.0 - np.divide(deja.sum(axis=1), nb_paires, out=np.zeros(occupants.shape[0]), where=nb_paires > 0)
+
+    def evaluer(self, plans: Union[np.ndarray, Sequence[Affectation]]) -> Dict[str, np.ndarray]:
+        """
+        Calcule toutes les métriques pour un lot de plans.
+
+        Args:
+            plans: Un lot (B, N) d'indices de sièges, ou une liste d'affectations.
+
+        Returns:
+            Pour chaque nom de `METRIQUES`, un tableau de B valeurs.
+        """
+        lot = plans if isinstance(plans, np.ndarray) else self.tableau(plans)
+        lot = np.atleast_2d(lot).astype(np.int64, copy=False)
+        occupants = self._occupants(lot)
+        return {
+            "violations": self._violations(lot, occupants),
+            "mixite_tables": self._mixite_tables(occupants),
+            "distance_bureau": self._distance_bureau(lot),
+            "nouveaute_voisins": self._nouveaute_voisins(occupants),
+        }
+
+    @staticmethod
+    def score(metriques: Mapping[str, np.ndarray], poids: Optional[Mapping[str, float]] = None) -> np.ndarray:
+        """
+        Combine les métriques en un score par plan (plus petit = meilleur).
+
+        Args:
+            metriques: Résultat de `evaluer`.
+            poids: Poids de chaque métrique (par défaut 1 ; la nouveauté compte négativement).
+        """
+        poids = dict(poids or {})
+        total = np.zeros(len(next(iter(metriques.values()))))
+        for nom, valeurs in metriques.items():
+            signe = -1.0 if nom == "nouveaute_voisins" else 1.0
+            total += signe * poids.get(nom, 1.0) * valeurs
+        return total
@@ -0,0 +1,289 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from plan_classe.model.salle import Salle
+from plan_classe.model.table import Table
+from plan_classe.ui.geometrie import centres_colonnes, rectangles_sieges
+
+if TYPE_CHECKING:
+    # Pygame n'est requis que pour l'export PNG : il est importé à la demande.
+    import pygame
+
+Couleur = Tuple[int, int, int]
+
+
+class RenduPlan:
+    """
+    Exporte un plan de classe (une salle et ses élèves placés) en PNG, SVG ou PDF,
+    sans ouvrir de fenêtre.
+
+    La mise en page reprend celle de `PlanVisuel` (bureau en haut, tables par rangées).
+    Un même rendu peut servir pour de nombreux plans : Pygame n'est initialisé qu'une
+    fois et les polices sont conservées en cache.
+    """
+
+    MARGE: int = 30
+    LARGEUR_SIEGES: int = 100
+    HAUTEUR_SIEGES: int = 30
+    ECART_VERTICAL: int = 20
+    ECART_HORIZONTAL: int = 40
+    DIM_BUREAU: Tuple[int, int] = (200, 60)
+    TAILLE_POLICE: int = 22
+    TAILLE_POLICE_VECTORIELLE: int = 11
+
+    COULEUR_FOND: Couleur = (255, 255, 255)
+    COULEUR_BUREAU: Couleur = (160, 160, 160)
+    COULEUR_SIEGE: Couleur = (139, 69, 19)
+    COULEUR_SIEGE_INVALIDE: Couleur = (80, 80, 80)
+    COULEUR_TEXTE_SIEGE: Couleur = (255, 255, 255)
+    COULEUR_TEXTE_BUREAU: Couleur = (0, 0, 0)
+
+    def __init__(self) -> None:
+        self._polices: Dict[int, "pygame.font.Font"] = {}
+        self._pygame_pret: bool = False
+
+    # -------------------------- Mise en page --------------------------
+
+    def _mise_en_page(self, salle: Salle) -> Tuple[int, int, List[Tuple[int, int, Table, int]]]:
+        """
+        Calcule les dimensions du plan et la position de chaque siège.
+
+        Returns:
+            (largeur, hauteur, liste des sièges (x, y, table, numéro de place)).
+        """
+        centres = centres_colonnes(salle, self.LARGEUR_SIEGES, self.ECART_HORIZONTAL, self.MARGE)
+        y_origine = self.MARGE + self.DIM_BUREAU[1] + 40
+        sieges = rectangles_sieges(salle, centres, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES,
+                                   self.ECART_VERTICAL, y_origine)
+
+        largeur_max = max((x + self.LARGEUR_SIEGES for x, _, _, _ in sieges), default=self.DIM_BUREAU[0])
+        hauteur_max = max((y + self.HAUTEUR_SIEGES for _, y, _, _ in sieges), default=y_origine)
+        largeur = max(largeur_max, self.DIM_BUREAU[0]) + self.MARGE
+        hauteur = hauteur_max + self.MARGE
+        return largeur, hauteur, sieges
+
+    def _position_bureau(self, largeur: int) -> Tuple[int, int]:
+        """Retourne le coin supérieur gauche du bureau, centré en haut du plan."""
+        return (largeur - self.DIM_BUREAU[0]) // 2, self.MARGE
+
+    def _couleur_siege(self, table: Table, index: int) -> Couleur:
+        return self.COULEUR_SIEGE if table.est_valide(index) else self.COULEUR_SIEGE_INVALIDE
+
+    # -------------------------- PNG (Pygame hors écran) --------------------------
+
+    def _police(self, taille: int) -> "pygame.font.Font":
+        """Retourne la police de la taille demandée, chargée une seule fois."""
+        import pygame
+
+        if not self._pygame_pret:
+            # Aucun affichage n'est nécessaire : seules les polices sont initialisées.
+            pygame.font.init()
+            self._pygame_pret = True
+        if taille not in self._polices:
+            self._polices[taille] = pygame.font.SysFont(None, taille)
+        return self._polices[taille]
+
+    def vers_png(self, salle: Salle, chemin: str) -> None:
+        """
+        Dessine le plan sur une surface Pygame hors écran et l'enregistre en PNG.
+
+        Args:
+            salle: La salle (avec ses élèves placés) à exporter.
+            chemin: Fichier de destination.
+        """
+        import pygame
+
+        police = self._police(self.TAILLE_POLICE)
+        largeur, hauteur, sieges = self._mise_en_page(salle)
+        surface = pygame.Surface((largeur, hauteur))
+        surface.fill(self.COULEUR_FOND)
+
+        x_bureau, y_bureau = self._position_bureau(largeur)
+        pygame.draw.rect(surface, self.COULEUR_BUREAU, (x_bureau, y_bureau, *self.DIM_BUREAU))
+        surface.blit(police.render("Bureau", True, self.COULEUR_TEXTE_BUREAU), (x_bureau + 60, y_bureau + 20))
+
+        for x, y, table, i in sieges:
+            pygame.draw.rect(surface, self._couleur_siege(table, i), (x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES))
+            if i > 0:
+                pygame.draw.line(surface, (255, 255, 255), (x, y), (x, y + self.HAUTEUR_SIEGES), 2)
+            eleve = table.get_places()[i]
+            if eleve:
+                surface.blit(police.render(eleve.get_nom(), True, self.COULEUR_TEXTE_SIEGE), (x + 5, y + 8))
+
+        pygame.image.save(surface, chemin)
+
+    # -------------------------- SVG --------------------------
+
+    def vers_svg(self, salle: Salle, chemin: str) -> None:
+        """
+        Exporte le plan au format SVG (vectoriel).
+
+        Args:
+            salle: La salle (avec ses élèves placés) à exporter.
+            chemin: Fichier de destination.
+        """
+        largeur, hauteur, sieges = self._mise_en_page(salle)
+        x_bureau, y_bureau = self._position_bureau(largeur)
+        l_bureau, h_bureau = self.DIM_BUREAU
+        taille = self.TAILLE_POLICE_VECTORIELLE
+
+        def rgb(couleur: Couleur) -> str:
+            return "rgb({},{},{})".format(*couleur)
+
+        lignes: List[str] = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{largeur}" height="{hauteur}" '
+            f'viewBox="0 0 {largeur} {hauteur}" font-family="Helvetica, Arial, sans-serif" font-size="{taille}">',
+            f'<rect width="{largeur}" height="{hauteur}" fill="{rgb(self.COULEUR_FOND)}"/>',
+            f'<rect x="{x_bureau}" y="{y_bureau}" width="{l_bureau}" height="{h_bureau}" '
+            f'fill="{rgb(self.COULEUR_BUREAU)}"/>',
+            f'<text x="{x_bureau + l_bureau // 2}" y="{y_bureau + h_bureau // 2}" text-anchor="middle" '
+            f'dominant-baseline="middle" fill="{rgb(self.COULEUR_TEXTE_BUREAU)}">Bureau</text>',
+        ]
+        for x, y, table, i in sieges:
+            lignes.append(f'<rect x="{x}" y="{y}" width="{self.LARGEUR_SIEGES}" height="{self.HAUTEUR_SIEGES}" '
+                          f'fill="{rgb(self._couleur_siege(table, i))}" stroke="white"/>')
+            eleve = table.get_places()[i]
+            if eleve:
+                lignes.append(f'<text x="{x + 5}" y="{y + self.HAUTEUR_SIEGES // 2}" dominant-baseline="middle" '
+                              f'fill="{rgb(self.COULEUR_TEXTE_SIEGE)}">{escape(eleve.get_nom())}</text>')
+        lignes.append("</svg>")
+
+        with open(chemin, "w", encoding="utf-8") as f:
+            f.write("\n".join(lignes))
+
+    # -------------------------- PDF --------------------------
+
+    @staticmethod
+    def _texte_pdf(texte: str) -> str:
+        """Encode une chaîne pour un littéral PDF (police standard en WinAnsi)."""
+        texte = texte.encode("cp1252", errors="replace").decode("latin-1")
+        return texte.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    def vers_pdf(self, salle: Salle, chemin: str) -> None:
+        """
+        Exporte le plan au format PDF (une page vectorielle, police Helvetica standard).
+
+        Args:
+            salle: La salle (avec ses élèves placés) à exporter.
+            chemin: Fichier de destination.
+        """
+        largeur, hauteur, sieges = self._mise_en_page(salle)
+        taille = self.TAILLE_POLICE_VECTORIELLE
+
+        def rect(x: int, y: int, l: int, h: int, couleur: Couleur) -> str:
+            # L'origine PDF est en bas à gauche : on retourne l'axe vertical.
+            r, g, b = (c / 255 for c in couleur)
+            return f"{r:.3f} {g:.3f} {b:.3f} rg {x} {hauteur - y - h} {l} {h} re f"
+
+        def texte(x: int, y: int, contenu: str, couleur: Couleur) -> str:
+            r, g, b = (c / 255 for c in couleur)
+            return (f"BT /F1 {taille} Tf {r:.3f} {g:.3f} {b:.3f} rg "
+                    f"{x} {hauteur - y} Td ({self._texte_pdf(contenu)}) Tj ET")
+
+        x_bureau, y_bureau = self._position_bureau(largeur)
+        l_bureau, h_bureau = self.DIM_BUREAU
+        operations: List[str] = [
+            rect(0, 0, largeur, hauteur, self.COULEUR_FOND),
+            rect(x_bureau, y_bureau, l_bureau, h_bureau, self.COULEUR_BUREAU),
+            texte(x_bureau + l_bureau // 2 - 20, y_bureau + h_bureau // 2 + 4, "Bureau", self.COULEUR_TEXTE_BUREAU),
+        ]
+        for x, y, table, i in sieges:
+            # Un liseré blanc d'un point sépare les places voisines.
+            operations.append(rect(x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES, (255, 255, 255)))
+            operations.append(rect(x + 1, y + 1, self.LARGEUR_SIEGES - 2, self.HAUTEUR_SIEGES - 2,
+                                   self._couleur_siege(table, i)))
+            eleve = table.get_places()[i]
+            if eleve:
+                operations.append(texte(x + 5, y + self.HAUTEUR_SIEGES // 2 + 4, eleve.get_nom(),
+                                        self.COULEUR_TEXTE_SIEGE))
+        contenu = "\n".join(operations).encode("latin-1")
+
+        objets: List[bytes] = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {largeur} {hauteur}] "
+            f"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>".encode("ascii"),
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+            b"<< /Length " + str(len(contenu)).encode("ascii") + b" >>\nstream\n" + contenu + b"\nendstream",
+        ]
+
+        donnees = bytearray(b"%PDF-1.4\n")
+        positions: List[int] = []
+        for numero, objet in enumerate(objets, start=1):
+            positions.append(len(donnees))
+            donnees += f"{numero} 0 obj\n".encode("ascii") + objet + b"\nendobj\n"
+        debut_xref = len(donnees)
+        donnees += f"xref\n0 {len(objets) + 1}\n0000000000 65535 f \n".encode("ascii")
+        for position in positions:
+            donnees += f"{position:010d} 00000 n \n".encode("ascii")
+        donnees += (f"trailer\n<< /Size {len(objets) + 1} /Root 1 0 R >>\n"
+                    f"startxref\n{debut_xref}\n%%EOF\n").encode("ascii")
+
+        with open(chemin, "wb") as f:
+            f.write(donnees)
+
+    # -------------------------- Aiguillage --------------------------
+
+    def exporter(self, salle: Salle, chemin: str) -> str:
+        """
+        Exporte le plan dans le format déduit de l'extension du fichier (.png, .svg ou .pdf).
+
+        Returns:
+            Le chemin du fichier écrit.
+
+        Raises:
+            ValueError: si l'extension n'est pas reconnue.
+        """
+        extension = os.path.splitext(chemin)[1].lower()
+        if extension == ".png":
+            self.vers_png(salle, chemin)
+        elif extension == ".svg":
+            self.vers_svg(salle, chemin)
+        elif extension == ".pdf":
+            self.vers_pdf(salle, chemin)
+        else:
+            raise ValueError(f"Format d'export non reconnu : {chemin}")
+        return chemin
+
+
+# Rendu partagé par tous les plans exportés dans un même processus.
+_rendu: Optional[RenduPlan] = None
+
+
+def _initialiser_rendu() -> None:
+    """Crée le rendu du processus courant (appelé une fois par processus de travail)."""
+    global _rendu
+    # Les processus de travail n'ouvrent jamais de fenêtre : pilote vidéo factice.
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    _rendu = RenduPlan()
+
+
+def _exporter_plan(plan: Tuple[Salle, str]) -> str:
+    """Point d'entrée d'un processus de travail : exporte un plan avec le rendu partagé."""
+    salle, chemin = plan
+    return _rendu.exporter(salle, chemin)
+
+
+def exporter_lot(plans: Iterable[Tuple[Salle, str]], processus: Optional[int] = None) -> List[str]:
+    """
+    Exporte de nombreux plans en parallèle.
+
+    Chaque processus de travail crée un seul `RenduPlan` qu'il réutilise pour tous les
+    plans qui lui sont confiés ; les plans sont envoyés par paquets pour limiter les échanges.
+
+    Args:
+        plans: Couples (salle, chemin de destination) ; le format suit l'extension.
+        processus: Nombre de processus (par défaut, le nombre de cœurs).
+
+    Returns:
+        Les chemins écrits, dans l'ordre des plans.
+    """
+    plans = list(plans)
+    if not plans:
+        return []
+    processus = processus or os.cpu_count() or 1
+    taille_paquet = max(1, len(plans) // (4 * processus))
+    with ProcessPoolExecutor(max_workers=processus, initializer=_initialiser_rendu) as executeur:
+        return list(executeur.map(_exporter_plan, plans, chunksize=taille_paquet))
@@ -0,0 +1,59 @@
+from typing import List, Tuple
+
+from plan_classe.model.salle import Salle
+from plan_classe.model.table import Table
+
+
+def centres_colonnes(salle: Salle, largeur_siege: int, ecart_horizontal: int, marge: int) -> List[int]:
+    """
+    Calcule l'abscisse (en pixels) du centre de chaque colonne de tables.
+
+    Args:
+        salle: La salle à dessiner.
+        largeur_siege: Largeur d'un siège.
+        ecart_horizontal: Espace entre deux colonnes.
+        marge: Marge à gauche de la première colonne.
+
+    Returns:
+        Liste des centres, un par colonne.
+    """
+    centres: List[int] = []
+    x_courant: int = marge
+    for colonne in salle.get_schema():
+        largeur_colonne: int = max(colonne) * largeur_siege
+        centres.append(x_courant + largeur_colonne // 2)
+        x_courant += largeur_colonne + ecart_horizontal
+    return centres
+
+
+def rectangles_sieges(
+        salle: Salle,
+        centres: List[int],
+        largeur_siege: int,
+        hauteur_siege: int,
+        ecart_vertical: int,
+        y_origine: int
+) -> List[Tuple[int, int, Table, int]]:
+    """
+    Calcule le coin supérieur gauche de chaque siège de la salle.
+
+    Args:
+        salle: La salle à dessiner.
+        centres: Centres des colonnes (voir `centres_colonnes`).
+        largeur_siege: Largeur d'un siège.
+        hauteur_siege: Hauteur d'un siège.
+        ecart_vertical: Espace entre deux rangées.
+        y_origine: Ordonnée de la première rangée.
+
+    Returns:
+        Liste de (x, y, table, numéro de place).
+    """
+    rectangles: List[Tuple[int, int, Table, int]] = []
+    for table in salle.get_tables():
+        col, row = table.get_position()
+        capacite: int = table.get_capacite()
+        x_base: int = centres[col] - (capacite * largeur_siege) // 2
+        y: int = y_origine + row * (hauteur_siege + ecart_vertical)
+        for i in range(capacite):
+            rectangles.append((x_base + i * largeur_siege, y, table, i))
+    return rectangles
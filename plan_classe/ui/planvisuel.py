@@ -4,6 +4,9 @@ from collections import defaultdict
 from plan_classe.model.salle import Salle
 from plan_classe.model.eleve import Eleve
 from plan_classe.model.table import Table
+from plan_classe.solveur.base import Affectation, affectation_courante
+from plan_classe.solveur.reparation import Reparateur
+from plan_classe.ui.geometrie import centres_colonnes, rectangles_sieges
 
 
 class PlanVisuel:
@@ -29,13 +32,17 @@ class PlanVisuel:
     ECART_VERTICAL: int = 20
     ECART_HORIZONTAL: int = 40
 
-    def __init__(self, salle: Salle, eleves: List[Eleve]) -> None:
+    OPTIONS_MENU: Tuple[str, ...] = ("Désactiver", "Réactiver", "Vider", "Libérer")
+
+    def __init__(self, salle: Salle, eleves: List[Eleve], reparateur: Optional[Reparateur] = None) -> None:
         """
         Initialise le visuel à partir de la salle et des élèves.
 
         Args:
             salle: La salle à dessiner.
             eleves: Liste des élèves à afficher dans la zone de droite.
+            reparateur: Si fourni, un élève chassé d'une place désactivée est replacé
+                        automatiquement à proximité au lieu de retourner dans la zone de droite.
         """
         pygame.init()
         self._font: pygame.font.Font = pygame.font.SysFont(None, 22)
@@ -44,6 +51,7 @@ class PlanVisuel:
 
         self._salle: Salle = salle
         self._eleves: List[Eleve] = eleves
+        self._reparateur: Optional[Reparateur] = reparateur
         self._scroll_offset: int = 0
         self._table_scroll_offset: int = 0
         self._surface_eleves: pygame.Surface = pygame.Surface((self.LARGEUR_ZONE_ELEVES, self.HAUTEUR_FENETRE))
@@ -60,15 +68,7 @@ class PlanVisuel:
         self._menu_table: Optional[Table] = None
         self._menu_index: Optional[int] = None
 
-        schema: List[List[int]] = salle.get_schema()
-        capacite_max_par_colonne: List[int] = [max(col) for col in schema]
-        x_courant: int = self.MARGE
-
-        for capacite_max in capacite_max_par_colonne:
-            largeur_colonne: int = capacite_max * self.LARGEUR_SIEGES
-            centre_colonne: int = x_courant + largeur_colonne // 2
-            self._centres_colonnes.append(centre_colonne)
-            x_courant += largeur_colonne + self.ECART_HORIZONTAL
+        self._centres_colonnes = centres_colonnes(salle, self.LARGEUR_SIEGES, self.ECART_HORIZONTAL, self.MARGE)
 
     def afficher(self) -> None:
         """
@@ -104,47 +104,43 @@ class PlanVisuel:
         texte: pygame.Surface = self._font.render("Bureau", True, (0, 0, 0))
         self._screen.blit(texte, (x + 60, y + 20))
 
+    def _sieges_a_l_ecran(self) -> List[Tuple[int, int, Table, int]]:
+        """Position à l'écran (coin supérieur gauche) de chaque siège, défilement compris."""
+        return rectangles_sieges(self._salle, self._centres_colonnes, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES,
+                                 self.ECART_VERTICAL, self.MARGE + 100 - self._table_scroll_offset)
+
     def _dessiner_tables(self) -> None:
         """Dessine les tables avec les élèves placés et enregistre les zones cliquables."""
         self._zones_places.clear()
 
-        for table in self._salle.get_tables():
+        for x, y, table, i in self._sieges_a_l_ecran():
             col, row = table.get_position()
-            capacite: int = table.get_capacite()
-
-            x_centre: int = self._centres_colonnes[col]
-            x_base: int = x_centre - (capacite * self.LARGEUR_SIEGES) // 2
-            y_base: int = self.MARGE + 100 + row * (
-                        self.HAUTEUR_SIEGES + self.ECART_VERTICAL) - self._table_scroll_offset
-
-            for i in range(capacite):
-                x: int = x_base + i * self.LARGEUR_SIEGES
-                y: int = y_base
-
-                self._zones_places.append((x, y, x + self.LARGEUR_SIEGES, y + self.HAUTEUR_SIEGES, table, i))
-                pygame.draw.rect(self._screen, (139, 69, 19), (x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES))
-                if self._siege_survole == (col, row, i):
-                    eleve_sur_place: Optional[Eleve] = table.get_places()[i]
-                    couleur_survol: Tuple[int, int, int] = (200, 80, 80) if eleve_sur_place else (100, 150, 255)
-                    couleur_siege: Tuple[int, int, int]
-                    if not table.est_valide(i):
-                        couleur_siege = (80, 80, 80)  # gris foncé pour place désactivée
-                    else:
-                        couleur_siege = (139, 69, 19)  # couleur bois classique
-
-                    pygame.draw.rect(self._screen, couleur_siege, (x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES))
-
-                    pygame.draw.rect(self._screen, couleur_survol, (x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES))
-                    pygame.draw.rect(self._screen, (255, 255, 255), (x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES),
-                                     width=2)
-
-                if i > 0:
-                    pygame.draw.line(self._screen, (255, 255, 255), (x, y), (x, y + self.HAUTEUR_SIEGES), 2)
-
-                eleve: Optional[Eleve] = table.get_places()[i]
-                if eleve:
-                    texte: pygame.Surface = self._font.render(eleve.get_nom(), True, (255, 255, 255))
-                    self._screen.blit(texte, (x + 5, y + 8))
+            self._zones_places.append((x, y, x + self.LARGEUR_SIEGES, y + self.HAUTEUR_SIEGES, table, i))
+            pygame.draw.rect(self._screen, (139, 69, 19), (x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES))
+            if self._siege_survole == (col, row, i):
+                eleve_sur_place: Optional[Eleve] = table.get_places()[i]
+                couleur_survol: Tuple[int, int, int] = (200, 80, 80) if eleve_sur_place else (100, 150, 255)
+                couleur_siege: Tuple[int, int, int]
+                if not table.est_valide(i):
+                    couleur_siege = (80, 80, 80)  # gris foncé pour place désactivée
+                else:
+                    couleur_siege = (139, 69, 19)  # couleur bois classique
+
+                pygame.draw.rect(self._screen, couleur_siege, (x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES))
+
+                pygame.draw.rect(self._screen, couleur_survol, (x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES))
+                pygame.draw.rect(self._screen, (255, 255, 255), (x, y, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES),
+                                 width=2)
+
+            if i > 0:
+                pygame.draw.line(self._screen, (255, 255, 255), (x, y), (x, y + self.HAUTEUR_SIEGES), 2)
+
+            eleve: Optional[Eleve] = table.get_places()[i]
+            if eleve:
+                texte: pygame.Surface = self._font.render(eleve.get_nom(), True, (255, 255, 255))
+                self._screen.blit(texte, (x + 5, y + 8))
+                if eleve.est_fixe():  # repère des élèves fixés, que la réparation ne déplace pas
+                    pygame.draw.circle(self._screen, (255, 215, 0), (x + self.LARGEUR_SIEGES - 6, y + 6), 3)
 
     def _dessiner_zone_eleves(self) -> None:
         """Affiche la zone latérale contenant les élèves non placés (scrollable)."""
@@ -205,16 +201,24 @@ class PlanVisuel:
         - si on vise une place libre : place l’élève
         - si on vise une place occupée : échange
         - sinon : remet l’élève dans la zone élève (avec tri)
+
+        Avec un réparateur, l'élève déposé est fixé à sa place (jusqu'à « Libérer » ou son
+        retour dans la zone élève) et l'élève qu'il remplace est replacé à proximité.
         """
         if not self._eleve_selectionne:
             return
 
         for x1, y1, x2, y2, table, index in self._zones_places:
             if x1 <= self._pos_souris[0] <= x2 and y1 <= self._pos_souris[1] <= y2:
+                avant = affectation_courante(self._salle)
                 ancien: Optional[Eleve] = table.get_places()[index]
-                table.placer_eleve(self._eleve_selectionne, index)
                 if ancien:
+                    table.liberer_place(index)
                     self.ajouter_eleve_et_trier(ancien)
+                table.placer_eleve(self._eleve_selectionne, index)
+                if self._reparateur is not None:
+                    self._eleve_selectionne.fixer()
+                    self._reparer(avant)
                 self._eleve_selectionne = None
                 self._dragging = False
                 return
@@ -306,24 +310,11 @@ class PlanVisuel:
             - (colonne, rangée, numéro_du_siege) si la souris est bien sur un siège.
             - None sinon.
         """
-        for table in self._salle.get_tables():
-            col, row = table.get_position()
-            capacite: int = table.get_capacite()
-
-            x_centre: int = self._centres_colonnes[col]
-            x_base: int = x_centre - (capacite * self.LARGEUR_SIEGES) // 2
-            y_base: int = self.MARGE + 100 + row * (
-                        self.HAUTEUR_SIEGES + self.ECART_VERTICAL) - self._table_scroll_offset
-
-            for i in range(capacite):
-                rect_siege: pygame.Rect = pygame.Rect(
-                    x_base + i * self.LARGEUR_SIEGES,
-                    y_base,
-                    self.LARGEUR_SIEGES,
-                    self.HAUTEUR_SIEGES
-                )
-                if rect_siege.collidepoint(x, y):
-                    return col, row, i
+        for x_siege, y_siege, table, i in self._sieges_a_l_ecran():
+            rect_siege: pygame.Rect = pygame.Rect(x_siege, y_siege, self.LARGEUR_SIEGES, self.HAUTEUR_SIEGES)
+            if rect_siege.collidepoint(x, y):
+                col, row = table.get_position()
+                return col, row, i
 
         return None
 
@@ -351,16 +342,15 @@ class PlanVisuel:
             return
 
         x, y = self._menu_position
-        options = ["Désactiver", "Réactiver", "Vider"]
         hauteur_option = 25
         largeur = 120
-        hauteur_totale = hauteur_option * len(options)
+        hauteur_totale = hauteur_option * len(self.OPTIONS_MENU)
 
         fond = pygame.Rect(x, y, largeur, hauteur_totale)
         pygame.draw.rect(self._screen, (240, 240, 240), fond)
         pygame.draw.rect(self._screen, (0, 0, 0), fond, 1)
 
-        for i, texte in enumerate(options):
+        for i, texte in enumerate(self.OPTIONS_MENU):
             surface = self._font.render(texte, True, (0, 0, 0))
             self._screen.blit(surface, (x + 5, y + i * hauteur_option + 5))
 
@@ -371,17 +361,20 @@ class PlanVisuel:
         x0, y0 = self._menu_position
         hauteur_option = 25
 
-        if not (x0 <= x <= x0 + 120 and y0 <= y <= y0 + hauteur_option * 3):
+        if not (x0 <= x <= x0 + 120 and y0 <= y <= y0 + hauteur_option * len(self.OPTIONS_MENU)):
             self._menu_contextuel_actif = False
             return
 
         i = (y - y0) // hauteur_option
 
         if i == 0:  # Désactiver
+            avant = affectation_courante(self._salle)
             if self._menu_table.get_places()[self._menu_index]:
                 self.ajouter_eleve_et_trier(self._menu_table.get_places()[self._menu_index])
                 self._menu_table.placer_eleve(None, self._menu_index)
             self._menu_table.invalider(self._menu_index)
+            if self._reparateur is not None:
+                self._reparer(avant)
 
         elif i == 1:  # Réactiver
             self._menu_table.revalider(self._menu_index)
@@ -391,11 +384,28 @@ class PlanVisuel:
                 self.ajouter_eleve_et_trier(self._menu_table.get_places()[self._menu_index])
                 self._menu_table.placer_eleve(None, self._menu_index)
 
+        elif i == 3:  # Libérer : l'élève pourra de nouveau être déplacé par la réparation
+            if self._menu_table.get_places()[self._menu_index]:
+                self._menu_table.get_places()[self._menu_index].liberer()
+
         self._menu_contextuel_actif = False
 
+    def _reparer(self, avant: Affectation) -> None:
+        """
+        Ré-optimise le voisinage de la modification, retire de la zone de droite les élèves
+        qui ont retrouvé une place et y remet ceux que la réparation a laissés sans place.
+        """
+        apres = self._reparateur.reparer(self._salle, avant)
+        self._eleves[:] = [eleve for eleve in self._eleves if eleve not in apres]
+        for eleve in sorted(set(avant) - set(apres)):
+            if eleve not in self._eleves:
+                self.ajouter_eleve_et_trier(eleve)
+
     def ajouter_eleve_et_trier(self, eleve: Eleve) -> None:
         """
         Ajoute un élève dans la zone des élèves tout en maintenant l’ordre alphabétique.
+        Un élève qui n'est plus assis n'est plus fixé.
         """
+        eleve.liberer()
         self._eleves.append(eleve)
         self._eleves.sort()
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from plan_classe.generateur import generer_contraintes_classe
+from plan_classe.solveur.contraintes import Contrainte, analyser
+
+LIGNES = [
+    '"DUPONT Léa" pas_a_cote "MARTIN Hugo"',
+    '"DUPONT Léa" a_cote "LE GALL Anne-Marie"',
+    '"MARTIN Hugo" rangees 0-2',
+    '"MARTIN Hugo" rangees 3',
+    '"DUPONT Léa" pres_bureau',
+    '"DUPONT Léa" pres_bureau 1.5',
+    'alterner_genre',
+]
+
+
+def test_aller_retour_texte():
+    contraintes = analyser(LIGNES)
+    assert len(contraintes) == len(LIGNES)
+    assert analyser(str(c) for c in contraintes) == contraintes
+
+
+def test_aller_retour_generateur():
+    rng = random.Random(0)
+    noms = [f"NOM{k} Prénom {k}" for k in range(30)]
+    lignes = generer_contraintes_classe(noms, rng, 200)
+    contraintes = analyser(lignes)
+    assert [str(c) for c in contraintes] == lignes
+    assert analyser(str(c) for c in contraintes) == contraintes
+
+
+def test_commentaires_et_lignes_vides_ignores():
+    assert analyser(["", "# commentaire", "  "]) == []
+
+
+def test_erreur_indique_la_ligne():
+    with pytest.raises(ValueError, match="Ligne 2"):
+        analyser(['"A" pas_a_cote "B"', '"A" inconnue "B"'])
+
+
+def test_egalite():
+    assert Contrainte("a_cote", ("A", "B")) == Contrainte("a_cote", ("A", "B"))
+    assert Contrainte("a_cote", ("A", "B")) != Contrainte("pas_a_cote", ("A", "B"))
@@ -0,0 +1,39 @@
+import pytest
+
+from plan_classe.model.eleve import Eleve
+from plan_classe.model.salle import Salle
+from plan_classe.solveur.examen import RepartiteurExamen, SolveurSalleExamen
+
+
+def _candidats(nb):
+    # Deux candidats sur trois ont un homonyme dans une autre classe.
+    return [Eleve(f"NOM{k % (nb // 3 * 2)} Prénom", "F" if k % 2 else "M", f"3{'ABC'[k % 3]}") for k in range(nb)]
+
+
+@pytest.mark.parametrize("parallele", [False, True])
+def test_repartir_homonymes_et_originaux(parallele):
+    eleves = _candidats(90)
+    salles = [Salle.depuis_mode_compact(4, [4, 4]) for _ in range(6)]
+    repartition = RepartiteurExamen(salles, SolveurSalleExamen(espacement=0)).repartir(eleves, parallele)
+
+    places = [couple for salle in repartition for couple in salle]
+    assert sorted(id(eleve) for eleve, _ in places) == sorted(id(eleve) for eleve in eleves)
+    for salle, couples in zip(salles, repartition):
+        for eleve, (x, y, i) in couples:
+            assert salle.get_table(x, y).get_places()[i] is eleve
+
+
+def test_modes_sequentiel_et_parallele_identiques():
+    resultats = []
+    for parallele in (False, True):
+        eleves = _candidats(60)
+        salles = [Salle.depuis_mode_compact(4, [2, 4]) for _ in range(5)]
+        indices = {id(eleve): k for k, eleve in enumerate(eleves)}
+        repartition = RepartiteurExamen(salles).repartir(eleves, parallele)
+        resultats.append([[(indices[id(e)], siege) for e, siege in salle] for salle in repartition])
+    assert resultats[0] == resultats[1]
+
+
+def test_resoudre_refuse_les_homonymes():
+    with pytest.raises(ValueError):
+        SolveurSalleExamen().resoudre(Salle.depuis_mode_compact(2, [4]), [Eleve("A B", "F"), Eleve("A B", "M")])
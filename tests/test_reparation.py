@@ -0,0 +1,80 @@
+from plan_classe.model.eleve import Eleve
+from plan_classe.model.salle import Salle
+from plan_classe.solveur.base import Solveur, affectation_courante
+from plan_classe.solveur.reparation import Reparateur, distance_sieges
+
+
+def _salle_remplie(nb_lignes, capacites, libres=()):
+    """Salle dont toutes les places sont occupées, sauf `libres`."""
+    salle = Salle.depuis_mode_compact(nb_lignes, capacites)
+    sieges = [siege for siege in salle.get_sieges() if siege not in libres]
+    eleves = [Eleve(f"NOM{k:02d} Prénom", "F" if k % 2 else "M") for k in range(len(sieges))]
+    Solveur.appliquer(salle, dict(zip(eleves, sieges)))
+    return salle, eleves
+
+
+def test_place_desactivee_avec_place_libre_proche():
+    salle, _ = _salle_remplie(4, [2, 2, 2], libres=[(1, 2, 1)])
+    avant = affectation_courante(salle)
+    chasse = salle.get_table(1, 1).get_places()[0]
+    salle.get_table(1, 1).invalider(0)
+
+    apres = Reparateur().reparer(salle, avant)
+
+    assert apres[chasse] == (1, 2, 1)
+    assert {e: s for e, s in apres.items() if e is not chasse} == {e: s for e, s in avant.items() if e is not chasse}
+    assert affectation_courante(salle) == apres
+
+
+def test_salle_pleine_laisse_l_eleve_sans_place():
+    salle, eleves = _salle_remplie(3, [2, 2])
+    avant = affectation_courante(salle)
+    chasse = salle.get_table(0, 2).get_places()[1]
+    salle.get_table(0, 2).invalider(1)
+
+    apres = Reparateur().reparer(salle, avant)
+
+    assert set(avant) - set(apres) == {chasse}
+    assert len(apres) == len(eleves) - 1
+    assert not salle.get_table(0, 2).est_valide(1) and salle.get_table(0, 2).get_places()[1] is None
+
+
+def test_depot_sur_place_occupee():
+    salle, _ = _salle_remplie(4, [2, 2, 2], libres=[(2, 1, 0), (0, 3, 0), (0, 3, 1)])
+    avant = affectation_courante(salle)
+    voisin_fixe = salle.get_table(2, 1).get_places()[1]
+    voisin_fixe.fixer()
+
+    # Comme dans PlanVisuel : l'élève déposé prend la place et y est fixé.
+    depose = Eleve("NOUVEAU Élève", "F")
+    table = salle.get_table(1, 1)
+    deplace = table.get_places()[1]
+    table.liberer_place(1)
+    table.placer_eleve(depose, 1)
+    depose.fixer()
+
+    apres = Reparateur().reparer(salle, avant)
+
+    assert apres[depose] == (1, 1, 1)
+    assert apres[voisin_fixe] == avant[voisin_fixe]
+    assert apres[deplace] == (2, 1, 0)
+    assert distance_sieges(avant[deplace], apres[deplace]) <= 1.5
+
+
+def test_zone_elargie_si_pas_de_place_proche():
+    salle, _ = _salle_remplie(5, [2, 2], libres=[(1, 4, 1)])
+    avant = affectation_courante(salle)
+    chasse = salle.get_table(0, 0).get_places()[0]
+    salle.get_table(0, 0).invalider(0)
+
+    apres = Reparateur().reparer(salle, avant)
+
+    assert len(apres) == len(avant)
+    assert chasse in apres and apres[chasse] != (0, 0, 0)
+    assert all(salle.get_table(x, y).est_valide(i) for x, y, i in apres.values())
+
+
+def test_sans_modification():
+    salle, _ = _salle_remplie(2, [2], libres=[(0, 1, 1)])
+    avant = affectation_courante(salle)
+    assert Reparateur().reparer(salle, avant) == avant
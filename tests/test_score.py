@@ -0,0 +1,72 @@
+import csv
+import random
+from collections import defaultdict
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from plan_classe.generateur import ecrire_pronote
+from plan_classe.model.eleve import Eleve
+from plan_classe.model.salle import Salle
+from plan_classe.solveur.base import places_libres
+from plan_classe.solveur.contraintes import Contrainte, ContraintesCompilees, charger_contraintes
+from plan_classe.solveur.score import EvaluateurPlans
+
+
+@pytest.fixture
+def classe(tmp_path):
+    chemin = str(tmp_path / "classe.csv")
+    ecrire_pronote(chemin, 30, graine=3, contraintes_par_classe=10, alterner_genre=True)
+    with open(chemin, encoding="utf-8-sig") as f:
+        eleves = [Eleve(ligne[0], ligne[3]) for ligne in csv.reader(f, delimiter=";")]
+    eleves.append(Eleve("SANS Genre", "X"))
+    contraintes = charger_contraintes(chemin) + [Contrainte("a_cote", (eleves[0].get_nom(), eleves[1].get_nom()))]
+    salle = Salle.depuis_mode_compact(6, [2, 3, 2])
+    salle.get_tables()[0].invalider(0)
+    return salle, eleves, contraintes
+
+
+def _plans_aleatoires(salle, eleves, nb):
+    # Un plan sur deux laisse des élèves sans place.
+    rng = random.Random(0)
+    places = places_libres(salle)
+    plans = []
+    for k in range(nb):
+        presents = eleves[:27] if k % 2 else eleves
+        plans.append(dict(zip(presents, rng.sample(places, len(presents)))))
+    return plans
+
+
+def test_violations_identiques_aux_contraintes_compilees(classe):
+    salle, eleves, contraintes = classe
+    plans = _plans_aleatoires(salle, eleves, 300)
+    metriques = EvaluateurPlans(salle, eleves, contraintes).evaluer(plans)
+
+    compilees = ContraintesCompilees(contraintes, salle, eleves)
+    attendu = [compilees.nb_violations(*compilees.etat(plan)) for plan in plans]
+    assert metriques["violations"].tolist() == attendu
+
+
+def test_mixite_tables(classe):
+    salle, eleves, _ = classe
+    plans = _plans_aleatoires(salle, eleves, 100)
+    metriques = EvaluateurPlans(salle, eleves).evaluer(plans)
+
+    def mixite(plan):
+        genres = defaultdict(list)
+        for eleve, (x, y, _) in plan.items():
+            genres[(x, y)].append(eleve.get_genre())
+        ecarts = [(g.count("F") - g.count("M"), g.count("F") + g.count("M")) for g in genres.values()]
+        return sum(abs(ecart) - effectif % 2 for ecart, effectif in ecarts)
+
+    assert metriques["mixite_tables"].tolist() == [mixite(plan) for plan in plans]
+    assert (metriques["mixite_tables"] >= 0).all()
+
+
+def test_nouveaute_voisins(classe):
+    salle, eleves, _ = classe
+    plans = _plans_aleatoires(salle, eleves, 3)
+    metriques = EvaluateurPlans(salle, eleves, historique=plans[:1]).evaluer(plans)
+    assert metriques["nouveaute_voisins"][0] == 0.0
+    assert (metriques["nouveaute_voisins"] <= 1.0).all()